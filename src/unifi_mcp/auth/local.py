@@ -1,15 +1,21 @@
 """Local controller authentication for UniFi OS and traditional controllers."""
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 import httpx
+import orjson
 
 from unifi_mcp.config import UniFiSettings
 from unifi_mcp.exceptions import UniFiAuthError, UniFiConnectionError
 
 logger = logging.getLogger(__name__)
 
+# How long a successful check_session result is trusted before re-probing
+SESSION_CHECK_TTL = 30.0
+
 
 class UniFiLocalAuth:
     """Handles authentication for local UniFi controllers.
@@ -29,6 +35,10 @@ class UniFiLocalAuth:
         self.settings = settings
         self._csrf_token: str | None = None
         self._is_authenticated = False
+        self._cached_headers: dict[str, str] | None = None
+        self._last_check_ok_at = 0.0
+        self._login_lock = asyncio.Lock()
+        self._generation = 0
 
     @property
     def is_authenticated(self) -> bool:
@@ -41,7 +51,14 @@ class UniFiLocalAuth:
         return self._csrf_token
 
     def _get_auth_headers(self) -> dict[str, str]:
-        """Get headers required for authenticated requests."""
+        """Get headers required for authenticated requests.
+
+        The dict is built once per session and reused until the CSRF token
+        or authentication state changes.
+        """
+        if self._cached_headers is not None:
+            return self._cached_headers
+
         headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
@@ -51,6 +68,7 @@ class UniFiLocalAuth:
         if self._csrf_token:
             headers["X-CSRF-Token"] = self._csrf_token
 
+        self._cached_headers = headers
         return headers
 
     async def login(self) -> bool:
@@ -87,6 +105,8 @@ class UniFiLocalAuth:
 
         if response.status_code == 200:
             self._is_authenticated = True
+            self._cached_headers = None
+            self._generation += 1
 
             # UniFi OS returns CSRF token in response header
             if "X-CSRF-Token" in response.headers:
@@ -104,7 +124,7 @@ class UniFiLocalAuth:
 
         # Try to extract error message from response
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             error_msg = data.get("meta", {}).get("msg", "Unknown error")
             raise UniFiAuthError(f"Authentication failed: {error_msg}")
         except UniFiAuthError:
@@ -117,7 +137,7 @@ class UniFiLocalAuth:
         if not self._is_authenticated:
             return
 
-        base_url = self.settings.controller_url.rstrip("/") if self.settings.controller_url else ""
+        base_url = self.settings.controller_url or ""
 
         if self.settings.is_udm:
             logout_url = f"{base_url}/api/auth/logout"
@@ -131,12 +151,16 @@ class UniFiLocalAuth:
         finally:
             self._is_authenticated = False
             self._csrf_token = None
+            self._cached_headers = None
+            self._last_check_ok_at = 0.0
             logger.info("Logged out from UniFi controller")
 
     async def refresh_session(self) -> bool:
         """Refresh the authentication session.
 
-        Attempts to re-authenticate if the session has expired.
+        Attempts to re-authenticate if the session has expired. Concurrent
+        callers are serialised; those that queued behind a refresh that
+        already succeeded reuse its session instead of logging in again.
 
         Returns:
             True if session was refreshed successfully
@@ -144,11 +168,20 @@ class UniFiLocalAuth:
         Raises:
             UniFiAuthError: If refresh fails
         """
-        logger.debug("Refreshing authentication session")
-        self._is_authenticated = False
-        self._csrf_token = None
+        # Snapshot the generation before queueing on the lock, then re-check it
+        # once the lock is held: if a login completed while we waited, reuse it.
+        generation = self._generation
+        async with self._login_lock:
+            if self._is_authenticated and self._generation != generation:
+                return True
+
+            logger.debug("Refreshing authentication session")
+            self._is_authenticated = False
+            self._csrf_token = None
+            self._cached_headers = None
+            self._last_check_ok_at = 0.0
 
-        return await self.login()
+            return await self.login()
 
     async def ensure_authenticated(self) -> None:
         """Ensure we have a valid authentication session.
@@ -158,28 +191,42 @@ class UniFiLocalAuth:
         Raises:
             UniFiAuthError: If authentication fails
         """
-        if not self._is_authenticated:
-            await self.login()
+        if self._is_authenticated:
+            return
+
+        async with self._login_lock:
+            if not self._is_authenticated:
+                await self.login()
 
     async def check_session(self) -> bool:
         """Check if the current session is still valid.
 
+        A successful check is trusted for SESSION_CHECK_TTL seconds so repeated
+        pre-flight checks don't each cost a round-trip.
+
         Returns:
             True if session is valid, False otherwise
         """
         if not self._is_authenticated:
             return False
 
+        if time.monotonic() - self._last_check_ok_at < SESSION_CHECK_TTL:
+            return True
+
         # Try to access self endpoint to verify session
         base_url = self.settings.api_base_url
         check_url = f"{base_url}/api/self"
 
         try:
             response = await self.client.get(check_url, headers=self._get_auth_headers())
-            return response.status_code == 200
         except Exception:
             return False
 
+        if response.status_code == 200:
+            self._last_check_ok_at = time.monotonic()
+            return True
+        return False
+
     def get_request_headers(self) -> dict[str, str]:
         """Get headers for authenticated API requests.
 
@@ -199,6 +246,11 @@ class UniFiCloudAuth:
             api_key: API key from unifi.ui.com
         """
         self.api_key = api_key
+        self._headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "X-API-KEY": api_key,
+        }
 
     def get_request_headers(self) -> dict[str, str]:
         """Get headers for authenticated API requests.
@@ -206,11 +258,7 @@ class UniFiCloudAuth:
         Returns:
             Dictionary of headers including API key
         """
-        return {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "X-API-KEY": self.api_key,
-        }
+        return self._headers
 
     @property
     def is_authenticated(self) -> bool:
@@ -1,23 +1,27 @@
 """Base HTTP client and lifespan management for UniFi MCP Server."""
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import Any
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable, MutableMapping
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
-from cachetools import TTLCache
-from mcp.server.fastmcp import FastMCP
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import orjson
+
+try:
+    import ijson
+except ImportError:  # optional: pip install unifi-mcp[speedups]
+    ijson = None
+
+if TYPE_CHECKING:
+    from cachetools import Cache
+    from mcp.server.fastmcp import FastMCP
 
 from unifi_mcp.auth.local import UniFiCloudAuth, UniFiLocalAuth
-from unifi_mcp.config import UniFiSettings, settings
+from unifi_mcp.config import UniFiSettings, get_settings
 from unifi_mcp.exceptions import (
     UniFiAPIError,
     UniFiAuthError,
@@ -28,8 +32,142 @@ from unifi_mcp.utils.privacy import mask_pii_data
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Transport retry policy: exponential backoff with jitter for connect errors
+# and timeouts.
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE = 1.0
+_BACKOFF_MAX = 10.0
+_RETRYABLE_ERRORS = (httpx.ConnectError, httpx.TimeoutException)
+
+# Upper bound on the logout request during shutdown
+_LOGOUT_TIMEOUT = 5.0
+
+# Bounds for the site name -> UUID map
+_SITE_IDS_MAXSIZE = 128
+_SITE_IDS_TTL = 300
+
+# Response-cache lifetime (seconds) for site paths that change faster or
+# slower than the configured cache_ttl
+_GET_TTLS = {
+    "stat/health": 5,
+    "stat/routing": 15,
+    "stat/sysinfo": 30,
+    "rest/networkconf": 30,
+    "rest/wlanconf": 30,
+    "rest/firewallrule": 30,
+    "rest/portconf": 60,
+}
+
+
+def _parse_retry_after(response: httpx.Response) -> int:
+    """Read the Retry-After header in seconds, defaulting to 60."""
+    try:
+        return int(response.headers.get("Retry-After", 60))
+    except ValueError:
+        return 60
+
+
+def _cache_key(endpoint: str, params: dict[str, Any] | None) -> tuple[Any, ...]:
+    """Build the response-cache key for a GET request."""
+    return (endpoint, frozenset(params.items()) if params else frozenset())
+
+
+def _endpoint_ttl(endpoint: str, default: float) -> float:
+    """Get the response-cache lifetime for an endpoint.
+
+    Site endpoints (``/api/s/{site}/...`` and ``/v1/sites/{id}/...``) are
+    matched on the path after the site segment.
+    """
+    parts = endpoint.split("/", 4)
+    if len(parts) < 5:
+        return default
+    return _GET_TTLS.get(parts[4], default)
+
+
+def _make_cache(maxsize: int, default_ttl: float) -> "Cache":
+    """Create the shared response cache with per-endpoint lifetimes."""
+    from cachetools import TLRUCache
+
+    def ttu(key: Any, value: Any, now: float) -> float:
+        endpoint = key[0]
+        return now + _endpoint_ttl(endpoint, default_ttl)
+
+    return TLRUCache(maxsize=maxsize, ttu=ttu)
+
+
+def _cloud_error_message(data: dict[str, Any]) -> str:
+    """Extract the error message from a Cloud API error body."""
+    return data.get("error", data.get("message", "Unknown error"))
+
+
+def _local_error_message(data: dict[str, Any]) -> str:
+    """Extract the error message from a local controller error body."""
+    try:
+        msg = data["meta"]["msg"]
+    except (KeyError, TypeError):
+        msg = ""
+    return msg or _cloud_error_message(data)
+
+
+def _needs_masking(data: Any) -> bool:
+    """Check whether a parsed payload has anything the PII masker could change.
+
+    Sensitive keys alone are not a safe test: MACs and IPs also appear inside
+    free-text values such as event messages. Only payloads without records,
+    like the ``{"meta": {"rc": "ok"}, "data": []}`` command acknowledgement,
+    skip the traversal.
+    """
+    if isinstance(data, dict):
+        return any(value for key, value in data.items() if key != "meta")
+    if isinstance(data, list | str):
+        return bool(data)
+    return False
+
+
+def _release_inflight(inflight: dict[Any, asyncio.Task[Any]], key: Any, task: asyncio.Task[Any]) -> None:
+    """Drop a finished request from the in-flight map."""
+    if inflight.get(key) is task:
+        del inflight[key]
+    # Mark the outcome as retrieved in case every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+class _AsyncByteReader:
+    """Async file-like view over a response body, as ijson expects."""
 
-@dataclass
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to tell bytes from str; don't consume a chunk
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _iter_path(data: Any, item_path: str) -> list[Any]:
+    """Select the items an ijson prefix like ``data.item`` refers to."""
+    for part in item_path.split("."):
+        if part == "item":
+            return data if isinstance(data, list) else []
+        data = data.get(part) if isinstance(data, dict) else None
+    return [data] if data is not None else []
+
+
+async def _aiter(items: Any) -> AsyncIterator[Any]:
+    """Iterate sync and async iterables alike."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+@dataclass(slots=True)
 class AppContext:
     """Application context with shared resources.
 
@@ -40,7 +178,19 @@ class AppContext:
     client: httpx.AsyncClient
     auth: UniFiLocalAuth | UniFiCloudAuth
     settings: UniFiSettings
-    cache: TTLCache
+    cache: "Cache"
+    # Site name (lower-cased) -> Integration API site UUID
+    site_ids: MutableMapping[str, str] = field(default_factory=dict)
+    # Protect listings and lookups derived from them,
+    # (NVR base URL, endpoint) -> (fetched at, data, ETag or None)
+    protect_cache: dict[Any, tuple[float, Any, str | None]] = field(default_factory=dict)
+    # Recent camera snapshots, (NVR base URL, camera, w, h, format) -> (taken at, image)
+    protect_snapshots: dict[Any, tuple[float, Any]] = field(default_factory=dict)
+    # Work currently in flight (uncached GETs keyed like cache entries,
+    # cached ones as ("get", cache key), plus other single-flight lookups);
+    # shared so that concurrent tool calls asking for the same resource share
+    # one request
+    inflight: dict[Any, asyncio.Task[Any]] = field(default_factory=dict)
 
 
 class UniFiHTTPClient:
@@ -57,18 +207,31 @@ class UniFiHTTPClient:
         """
         self.ctx = ctx
         self._retry_count = 0
+        # The lifespan client already carries api_base_url as its base_url, so
+        # endpoints are handed to httpx as-is; bare clients get the full URL.
+        self._url_prefix = "" if str(ctx.client.base_url) else ctx.settings.api_base_url
+        # Bound once so the request hot path skips the attribute chains
+        self._send = ctx.client.request
+        self._get_headers = ctx.auth.get_request_headers
+        # The API mode is fixed once the lifespan has started, so pick the
+        # response shape handlers up front
+        if ctx.settings.mode == "cloud":
+            self._parse_response = self._parse_cloud
+            self._error_message = _cloud_error_message
+        else:
+            self._parse_response = self._parse_local
+            self._error_message = _local_error_message
+        self._ensure_pool()
+
+    def _ensure_pool(self) -> None:
+        """Warn when the shared connection pool has already been closed.
+
+        All requests go through the lifespan's single pooled AsyncClient;
+        a closed one means the client outlived the server lifespan.
+        """
+        if self.ctx.client.is_closed:
+            logger.warning("Shared HTTP client is closed; requests will fail until restart")
 
-    @property
-    def _headers(self) -> dict[str, str]:
-        """Get headers for requests."""
-        return self.ctx.auth.get_request_headers()
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException)),
-        reraise=True,
-    )
     async def _make_request(
         self,
         method: str,
@@ -77,6 +240,9 @@ class UniFiHTTPClient:
     ) -> httpx.Response:
         """Make an HTTP request with retry logic.
 
+        Connection errors and timeouts are retried with exponential backoff
+        and jitter; the happy path is a single awaited request.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             url: Request URL
@@ -87,23 +253,26 @@ class UniFiHTTPClient:
 
         Raises:
             UniFiConnectionError: If connection fails after retries
-            UniFiAuthError: If authentication fails
-            UniFiRateLimitError: If rate limited
-            UniFiAPIError: For other API errors
         """
-        try:
-            response = await self.ctx.client.request(
-                method,
-                url,
-                headers=self._headers,
-                **kwargs,
-            )
-        except httpx.ConnectError as e:
-            raise UniFiConnectionError(f"Failed to connect: {e}") from e
-        except httpx.TimeoutException as e:
-            raise UniFiConnectionError(f"Request timed out: {e}") from e
-
-        return response
+        error: httpx.TransportError | None = None
+        for attempt in range(_MAX_ATTEMPTS):
+            if attempt:
+                delay = min(_BACKOFF_MAX, _BACKOFF_BASE * 2 ** (attempt - 1))
+                await asyncio.sleep(delay * (1 + 0.5 * random.random()))
+            try:
+                return await self._send(
+                    method,
+                    url,
+                    headers=self._get_headers(),
+                    **kwargs,
+                )
+            except _RETRYABLE_ERRORS as e:
+                error = e
+
+        # Retries exhausted: wrap the last transport error exactly once
+        if isinstance(error, httpx.TimeoutException):
+            raise UniFiConnectionError(f"Request timed out: {error}") from error
+        raise UniFiConnectionError(f"Failed to connect: {error}") from error
 
     async def request(
         self,
@@ -113,6 +282,10 @@ class UniFiHTTPClient:
     ) -> dict[str, Any]:
         """Make an authenticated API request.
 
+        Identical GETs issued while one is already in flight share its
+        response instead of hitting the controller again. Commands sent to
+        a site's ``cmd/`` endpoints drop that site's cached responses.
+
         Args:
             method: HTTP method
             endpoint: API endpoint (will be appended to base URL)
@@ -124,7 +297,53 @@ class UniFiHTTPClient:
         Raises:
             UniFiAPIError: For API errors
         """
-        url = f"{self.ctx.settings.api_base_url}{endpoint}"
+        if method != "GET":
+            data = await self._dispatch(method, endpoint, **kwargs)
+            # Commands change controller state, so cached reads may be stale
+            if "/cmd/" in endpoint:
+                self._invalidate_after_command(endpoint, kwargs.get("json"))
+            return data
+
+        if not kwargs.keys() <= {"params"}:
+            return await self._dispatch(method, endpoint, **kwargs)
+
+        key = _cache_key(endpoint, kwargs.get("params"))
+        return await self._single_flight(key, lambda: self._dispatch(method, endpoint, **kwargs))
+
+    async def _single_flight(self, key: Any, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory()`` once for all concurrent callers using the same key.
+
+        The first caller starts the work; callers arriving while it is still
+        running await the same task instead of starting their own.
+
+        Args:
+            key: Identifies the shared work in ``AppContext.inflight``
+            factory: Creates the coroutine to run when nothing is in flight
+
+        Returns:
+            The result of the shared work
+        """
+        inflight = self.ctx.inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            inflight[key] = task
+            task.add_done_callback(lambda t: _release_inflight(inflight, key, t))
+
+        # Shield so one caller being cancelled doesn't cancel the shared work
+        return await asyncio.shield(task)
+
+    async def _dispatch(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a request and turn the response into data or an exception."""
+        url = f"{self._url_prefix}{endpoint}" if self._url_prefix else endpoint
+        if "json" in kwargs:
+            # Encode once with orjson; the auth headers already declare JSON
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
 
         response = await self._make_request(method, url, **kwargs)
 
@@ -138,24 +357,151 @@ class UniFiHTTPClient:
                 except UniFiAuthError:
                     raise UniFiAuthError("Session expired and refresh failed")
 
-        # Handle rate limiting
-        if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
-            raise UniFiRateLimitError(
-                f"Rate limited, retry after {retry_after}s",
-                retry_after=retry_after,
-            )
+        # Handle rate limiting: wait out short Retry-After windows ourselves and
+        # only surface the error once the retry budget is spent
+        retries_left = self.ctx.settings.rate_limit_retries
+        while response.status_code == 429:
+            retry_after = _parse_retry_after(response)
+            if retries_left <= 0 or retry_after > self.ctx.settings.rate_limit_max_wait:
+                raise UniFiRateLimitError(
+                    f"Rate limited, retry after {retry_after}s",
+                    retry_after=retry_after,
+                )
+            retries_left -= 1
+            logger.debug(f"Rate limited on {endpoint}, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+            response = await self._make_request(method, url, **kwargs)
 
         # Handle other errors
         if response.status_code >= 400:
             await self._handle_error_response(response)
 
         data = self._parse_response(response)
+        if not self.ctx.settings.mask_pii or not _needs_masking(data):
+            return data
         return mask_pii_data(data)
 
-    async def get(self, endpoint: str, **kwargs: Any) -> dict[str, Any]:
-        """Make a GET request."""
-        return await self.request("GET", endpoint, **kwargs)
+    async def get(
+        self, endpoint: str, bypass_cache: bool = False, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Make a GET request, served from the shared response cache when fresh.
+
+        A cache miss joins an identical ``get()`` already in flight if there
+        is one; otherwise it fetches, and the fetching task fills the cache
+        once for every caller that shared it. Uncached ``request("GET")``
+        calls are coalesced separately, as they never fill the cache.
+
+        Args:
+            endpoint: API endpoint
+            bypass_cache: Always fetch from the controller (the fresh result
+                still replaces the cached one)
+            **kwargs: Additional arguments (params)
+
+        Returns:
+            Parsed (and, if enabled, PII-masked) response data
+        """
+        if not kwargs.keys() <= {"params"}:
+            return await self.request("GET", endpoint, **kwargs)
+
+        key = _cache_key(endpoint, kwargs.get("params"))
+        if not bypass_cache:
+            try:
+                return self.ctx.cache[key]
+            except KeyError:
+                pass
+
+        return await self._single_flight(
+            ("get", key), lambda: self._fetch_and_cache(key, endpoint, **kwargs)
+        )
+
+    async def _fetch_and_cache(self, key: Any, endpoint: str, **kwargs: Any) -> Any:
+        """Fetch a GET response and store it in the response cache."""
+        data = await self._dispatch("GET", endpoint, **kwargs)
+        self.ctx.cache[key] = data
+        return data
+
+    async def batch_get(self, endpoints: list[str]) -> list[Any]:
+        """GET several unrelated endpoints concurrently.
+
+        Args:
+            endpoints: API endpoints
+
+        Returns:
+            One entry per endpoint, in order: the parsed response, or the
+            exception raised for it
+        """
+        return await asyncio.gather(*(self.get(e) for e in endpoints), return_exceptions=True)
+
+    async def stream_items(
+        self, endpoint: str, item_path: str = "data.item", **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a large list response as they are decoded.
+
+        With ijson installed items are parsed incrementally from the body;
+        otherwise the body is read once and decoded with orjson. Streamed
+        reads bypass the response cache and are not retried.
+
+        Args:
+            endpoint: API endpoint
+            item_path: ijson prefix of the items to yield
+            **kwargs: Additional arguments (params)
+
+        Yields:
+            Decoded (and, if enabled, PII-masked) items
+
+        Raises:
+            UniFiAPIError: For API errors
+        """
+        url = f"{self._url_prefix}{endpoint}" if self._url_prefix else endpoint
+        mask = self.ctx.settings.mask_pii
+
+        try:
+            async with self.ctx.client.stream(
+                "GET", url, headers=self._get_headers(), **kwargs
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    await self._handle_error_response(response)
+
+                if ijson is not None:
+                    reader = _AsyncByteReader(response.aiter_bytes())
+                    items = ijson.items(reader, item_path, use_float=True)
+                else:
+                    await response.aread()
+                    items = _iter_path(self._decode(response), item_path)
+
+                async for item in _aiter(items):
+                    yield mask_pii_data(item) if mask else item
+        except httpx.TimeoutException as e:
+            raise UniFiConnectionError(f"Request timed out: {e}") from e
+        except httpx.TransportError as e:
+            raise UniFiConnectionError(f"Failed to connect: {e}") from e
+
+    def _invalidate_after_command(self, endpoint: str, payload: Any) -> None:
+        """Drop cached responses a ``cmd/`` request may have made stale.
+
+        The base implementation drops everything cached for the command's
+        site; API clients narrow this to what each command affects.
+
+        Args:
+            endpoint: Command endpoint, e.g. ``/api/s/default/cmd/stamgr``
+            payload: JSON body that was sent
+        """
+        scope = endpoint.partition("/cmd/")[0]
+        self.invalidate_cache(f"{scope}/")
+
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """Drop cached GET responses for endpoints starting with ``prefix``.
+
+        Args:
+            prefix: Endpoint prefix to evict; empty evicts everything
+        """
+        cache = self.ctx.cache
+        if not prefix:
+            cache.clear()
+            return
+        for key in [k for k in list(cache) if k[0].startswith(prefix)]:
+            cache.pop(key, None)
 
     async def post(self, endpoint: str, **kwargs: Any) -> dict[str, Any]:
         """Make a POST request."""
@@ -169,8 +515,38 @@ class UniFiHTTPClient:
         """Make a DELETE request."""
         return await self.request("DELETE", endpoint, **kwargs)
 
-    def _parse_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Parse API response.
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        """Decode a JSON response body."""
+        try:
+            return orjson.loads(response.content)
+        except Exception as e:
+            raise UniFiAPIError(f"Failed to parse response: {e}")
+
+    def _parse_cloud(self, response: httpx.Response) -> dict[str, Any]:
+        """Parse a Cloud API (api.ui.com) response.
+
+        Cloud API returns data directly without the meta wrapper.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Parsed response data
+        """
+        data = self._decode(response)
+
+        # Check for error in cloud response
+        try:
+            error = data["error"]
+        except (KeyError, TypeError):
+            return data
+        if error:
+            raise UniFiAPIError(error, response.status_code, data)
+        return data
+
+    def _parse_local(self, response: httpx.Response) -> dict[str, Any]:
+        """Parse a local controller API response.
 
         UniFi API returns responses in format:
         {
@@ -178,29 +554,21 @@ class UniFiHTTPClient:
             "data": [...]
         }
 
-        Cloud API (api.ui.com) returns data directly or in a simpler format.
-
         Args:
             response: HTTP response
 
         Returns:
             Parsed response data
         """
-        try:
-            data = response.json()
-        except Exception as e:
-            raise UniFiAPIError(f"Failed to parse response: {e}")
+        data = self._decode(response)
 
-        # Cloud API returns data directly without meta wrapper
-        if self.ctx.settings.mode == "cloud":
-            # Check for error in cloud response
-            if isinstance(data, dict) and data.get("error"):
-                raise UniFiAPIError(data.get("error", "Unknown API error"), response.status_code, data)
+        # Check for API-level errors
+        try:
+            meta = data["meta"]
+            rc = meta["rc"]
+        except (KeyError, TypeError):
             return data
-
-        # Check for API-level errors (local controller format)
-        meta = data.get("meta", {})
-        if meta.get("rc") == "error":
+        if rc == "error":
             msg = meta.get("msg", "Unknown API error")
             raise UniFiAPIError(msg, response.status_code, data)
 
@@ -217,12 +585,10 @@ class UniFiHTTPClient:
             UniFiAPIError: For other errors
         """
         try:
-            data = response.json()
-            error_msg = data.get("meta", {}).get("msg", "")
-            if not error_msg:
-                error_msg = data.get("error", data.get("message", "Unknown error"))
+            error_msg = self._error_message(orjson.loads(response.content))
         except Exception:
-            error_msg = response.text or "Unknown error"
+            # Non-JSON bodies (e.g. proxy HTML pages) are only shown as a bounded prefix
+            error_msg = response.content[:200].decode("utf-8", errors="replace") or "Unknown error"
 
         if response.status_code == 401:
             raise UniFiAuthError(f"Authentication required: {error_msg}")
@@ -232,9 +598,46 @@ class UniFiHTTPClient:
         raise UniFiAPIError(error_msg, response.status_code)
 
 
+async def _session_refresh_loop(auth: UniFiLocalAuth, interval: float) -> None:
+    """Re-login periodically so sessions are renewed before they expire.
+
+    Args:
+        auth: Session auth handler to refresh
+        interval: Seconds between refreshes
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await auth.refresh_session()
+            logger.debug("Background session refresh succeeded")
+        except (UniFiAuthError, UniFiConnectionError) as e:
+            # Requests fall back to refreshing on 401, so just try again later
+            logger.warning(f"Background session refresh failed: {e}")
+
+
+async def _logout(auth: UniFiLocalAuth) -> None:
+    """Log out during shutdown without letting a hung controller stall it."""
+    try:
+        await asyncio.wait_for(auth.logout(), timeout=_LOGOUT_TIMEOUT)
+    except TimeoutError:
+        logger.warning(f"Logout did not complete within {_LOGOUT_TIMEOUT}s, skipping")
+
+
+def _http2_enabled(settings: UniFiSettings) -> bool:
+    """Whether to offer HTTP/2, falling back to HTTP/1.1 if h2 is missing."""
+    if not settings.http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP/2 requested but the h2 package is missing; using HTTP/1.1")
+        return False
+    return True
+
+
 @asynccontextmanager
 async def create_app_lifespan(
-    server: FastMCP,
+    server: "FastMCP",
 ) -> AsyncIterator[AppContext]:
     """Create and manage application lifecycle.
 
@@ -248,73 +651,101 @@ async def create_app_lifespan(
         AppContext with initialized resources
     """
     logger.info("Initializing UniFi MCP Server")
-
-    # Create HTTP client with connection pooling
-    client = httpx.AsyncClient(
-        timeout=settings.request_timeout,
-        limits=httpx.Limits(
-            max_keepalive_connections=5,
-            max_connections=settings.max_connections,
-        ),
-        verify=settings.verify_ssl,
-    )
-
-    # Initialize auth based on configured devices or legacy mode
-    device = settings.get_device()
-    if device and device.has_protect_credentials:
-        # Multi-device mode with credentials: use session auth
-        # Populate legacy settings from device so UniFiLocalAuth works
-        settings.controller_url = device.url
-        settings.username = device.username
-        settings.password = device.password
-        settings.is_udm = True
-        settings.mode = "local"
-        auth: UniFiLocalAuth | UniFiCloudAuth = UniFiLocalAuth(client, settings)
-        logger.info(f"Using device session authentication for {device.name} ({device.url})")
-    elif device:
-        # Multi-device mode without credentials: use API key
-        auth = UniFiCloudAuth(device.api_key)
-        logger.info(f"Using device API key authentication for {device.name} ({device.url})")
-    elif settings.uses_api_key:
-        if not settings.cloud_api_key:
-            raise UniFiAuthError("API key is required for cloud/local_api_key mode")
-        auth = UniFiCloudAuth(settings.cloud_api_key)
-        if settings.mode == "cloud":
-            logger.info("Using cloud authentication (api.ui.com)")
+    settings = get_settings()
+
+    # Cleanup callbacks run in reverse registration order: stop the refresh
+    # task, log out (bounded), then close the connection pool.
+    async with AsyncExitStack() as stack:
+        stack.callback(logger.info, "Cleanup complete")
+
+        # Create HTTP client with connection pooling. Keep every pooled connection
+        # alive between (possibly infrequent) tool calls and multiplex concurrent
+        # ones over HTTP/2 so bursts don't pay for fresh TLS handshakes. This one
+        # client lives for the whole server lifetime; tools must not make their own.
+        client = httpx.AsyncClient(
+            base_url=settings.api_base_url,
+            timeout=httpx.Timeout(settings.request_timeout, connect=settings.connect_timeout),
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.max_connections,
+                max_connections=settings.max_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            verify=settings.verify_ssl,
+            http2=_http2_enabled(settings),
+        )
+        stack.push_async_callback(client.aclose)
+
+        # Initialize auth based on configured devices or legacy mode
+        device = settings.get_device()
+        if device and device.has_protect_credentials:
+            # Multi-device mode with credentials: use session auth
+            # Populate legacy settings from device so UniFiLocalAuth works
+            settings.controller_url = device.url
+            settings.username = device.username
+            settings.password = device.password
+            settings.is_udm = True
+            settings.mode = "local"
+            auth: UniFiLocalAuth | UniFiCloudAuth = UniFiLocalAuth(client, settings)
+            logger.info(f"Using device session authentication for {device.name} ({device.url})")
+        elif device:
+            # Multi-device mode without credentials: use API key
+            auth = UniFiCloudAuth(device.api_key)
+            logger.info(f"Using device API key authentication for {device.name} ({device.url})")
+        elif settings.uses_api_key:
+            if not settings.cloud_api_key:
+                raise UniFiAuthError("API key is required for cloud/local_api_key mode")
+            auth = UniFiCloudAuth(settings.cloud_api_key)
+            if settings.mode == "cloud":
+                logger.info("Using cloud authentication (api.ui.com)")
+            else:
+                logger.info(
+                    f"Using local Integration API authentication for {settings.controller_url}"
+                )
         else:
-            logger.info(f"Using local Integration API authentication for {settings.controller_url}")
-    else:
-        auth = UniFiLocalAuth(client, settings)
-        logger.info(f"Using local session authentication for {settings.controller_url}")
+            auth = UniFiLocalAuth(client, settings)
+            logger.info(f"Using local session authentication for {settings.controller_url}")
 
-    # Initialize cache
-    cache: TTLCache = TTLCache(maxsize=100, ttl=settings.cache_ttl)
+        # Initialize caches: responses with per-endpoint lifetimes (see
+        # _GET_TTLS), site UUIDs bounded so sites removed upstream age out
+        from cachetools import TTLCache
 
-    # Create context
-    ctx = AppContext(
-        client=client,
-        auth=auth,
-        settings=settings,
-        cache=cache,
-    )
+        cache = _make_cache(settings.cache_maxsize, settings.cache_ttl)
+        site_ids: TTLCache = TTLCache(maxsize=_SITE_IDS_MAXSIZE, ttl=_SITE_IDS_TTL)
+
+        # Create context
+        ctx = AppContext(
+            client=client,
+            auth=auth,
+            settings=settings,
+            cache=cache,
+            site_ids=site_ids,
+        )
 
-    try:
         # Authenticate on startup (local session mode only)
         if isinstance(auth, UniFiLocalAuth):
+            stack.push_async_callback(_logout, auth)
             await auth.login()
             logger.info("Successfully authenticated with UniFi controller")
+
+            refresh_interval = settings.session_ttl - settings.session_prefetch
+            if settings.session_ttl > 0 and refresh_interval > 0:
+                refresh_task = asyncio.create_task(
+                    _session_refresh_loop(auth, refresh_interval)
+                )
+                stack.callback(refresh_task.cancel)
         else:
             # For API key modes, just log the configured endpoint
             logger.info(f"API key configured, endpoint: {settings.api_base_url}")
 
-        yield ctx
+        # Log in to Protect in the background so the first events/thumbnail
+        # call doesn't pay for it. Imported here: protect.py imports this module.
+        from unifi_mcp.clients.protect import UniFiProtectClient
 
-    finally:
-        # Cleanup
-        logger.info("Shutting down UniFi MCP Server")
+        for protect_device in settings.get_protect_devices():
+            if protect_device.has_protect_credentials:
+                warmup = asyncio.create_task(UniFiProtectClient(client, protect_device).warmup())
+                stack.callback(warmup.cancel)
 
-        if isinstance(auth, UniFiLocalAuth):
-            await auth.logout()
+        stack.callback(logger.info, "Shutting down UniFi MCP Server")
 
-        await client.aclose()
-        logger.info("Cleanup complete")
+        yield ctx
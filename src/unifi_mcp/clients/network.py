@@ -1,13 +1,89 @@
 """UniFi Network API client."""
 
+import asyncio
 import logging
-from typing import Any
+import sys
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from functools import lru_cache
+from typing import Any, NamedTuple
 
-from unifi_mcp.clients.base import AppContext, UniFiHTTPClient
-from unifi_mcp.exceptions import UniFiNotFoundError
+from unifi_mcp.clients.base import AppContext, UniFiHTTPClient, _cache_key
+from unifi_mcp.exceptions import UniFiAPIError, UniFiNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Lower-cases hex digits and drops separators in one pass
+_MAC_LOWER_STRIP = str.maketrans("ABCDEF", "abcdef", ":-_. ")
+
+
+def _norm_mac(mac: str) -> str:
+    """Normalize a MAC address for comparison (``aabbccddeeff``)."""
+    return mac.translate(_MAC_LOWER_STRIP)
+
+
+def _colon_mac(mac: str) -> str:
+    """Format a MAC address the way the controller uses it in paths."""
+    mac = _norm_mac(mac)
+    if len(mac) != 12:
+        return mac
+    return ":".join((mac[0:2], mac[2:4], mac[4:6], mac[6:8], mac[8:10], mac[10:12]))
+
+
+# Command manager -> site paths whose cached responses its commands affect;
+# other managers drop the whole site
+_CMD_INVALIDATES = {
+    "stamgr": ("stat/sta", "stat/alluser", "rest/user"),
+    "devmgr": ("stat/device", "stat/health"),
+    "evtmgr": ("stat/alarm", "stat/event"),
+}
+
+# Commands that only read state, so they leave every cache in place
+_READ_ONLY_CMDS = frozenset({"speedtest-status"})
+
+# stamgr commands that only flip the "blocked" flag of known clients
+_BLOCK_CMDS = {"block-sta": True, "unblock-sta": False}
+
+# stamgr commands that take a "macs" list rather than a single "mac"
+_STAMGR_BATCH_CMDS = frozenset({"forget-sta"})
+
+
+@lru_cache(maxsize=512)
+def _site_path(site: str, path: str) -> str:
+    """Build (once) the traditional API path for a site resource."""
+    return sys.intern(f"/api/s/{site}/{path}")
+
+
+@lru_cache(maxsize=512)
+def _integration_path(site_id: str, path: str) -> str:
+    """Build (once) the Integration API path for a site resource."""
+    return sys.intern(f"/v1/sites/{site_id}/{path}")
+
+
+class ConfigBundle(NamedTuple):
+    """Site configuration fetched in one concurrent batch."""
+
+    networks: list[dict[str, Any]]
+    wlans: list[dict[str, Any]]
+    port_profiles: list[dict[str, Any]]
+    firewall_rules: list[dict[str, Any]]
+    routes: list[dict[str, Any]]
+    # Part name -> error message for parts that failed (their list is empty)
+    errors: dict[str, str]
+
+
+# ConfigBundle field -> traditional API path
+_CONFIG_BUNDLE_PATHS = {
+    "networks": "rest/networkconf",
+    "wlans": "rest/wlanconf",
+    "port_profiles": "rest/portconf",
+    "firewall_rules": "rest/firewallrule",
+    "routes": "stat/routing",
+}
+
+
+ListFetcher = Callable[[str | None], Awaitable[list[dict[str, Any]]]]
+
 
 class UniFiNetworkClient(UniFiHTTPClient):
     """Client for UniFi Network Controller API.
@@ -30,13 +106,76 @@ class UniFiNetworkClient(UniFiHTTPClient):
         self.mode = ctx.settings.mode
         self.is_cloud = self.mode == "cloud"
         self.is_integration_api = self.mode == "local_api_key"
-        self._site_id_cache: dict[str, str] = {}
+        # Shared across clients: a new client is created for every tool call
+        self._site_id_cache = ctx.site_ids
+        self._list_fetchers = self._build_list_fetchers()
+
+    def _build_list_fetchers(self) -> dict[str, ListFetcher]:
+        """Bind each list resource to the endpoint for the current mode.
+
+        Returns:
+            Mapping of resource name to an async ``fetch(site)`` callable
+        """
+        local = self._fetch_local_list
+        if self.is_integration_api:
+            integration = self._fetch_integration_list
+            return {
+                "sites": lambda site: self._fetch_list("/v1/sites"),
+                "health": self._integration_health,
+                "devices": lambda site: integration("devices", site),
+                "clients": lambda site: integration("clients", site),
+                "networks": lambda site: integration("networks", site),
+            }
+        if self.is_cloud:
+            return {
+                "sites": lambda site: self._fetch_list("/v1/sites"),
+                "health": self._cloud_health,
+                "devices": lambda site: self._fetch_list("/v1/devices"),
+                "clients": lambda site: self._fetch_list("/v1/clients"),
+                "networks": lambda site: local("rest/networkconf", site),
+            }
+        return {
+            "sites": lambda site: self._fetch_list("/api/self/sites"),
+            "health": lambda site: local("stat/health", site),
+            "devices": lambda site: local("stat/device", site),
+            "clients": lambda site: local("stat/sta", site),
+            "networks": lambda site: local("rest/networkconf", site),
+        }
+
+    async def _fetch_list(self, endpoint: str) -> list[dict[str, Any]]:
+        """GET an endpoint and unwrap its list payload.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            List of data items
+        """
+        response = await self.get(endpoint)
+        # Decoded JSON is exactly list or dict, so identity checks suffice
+        if type(response) is list:
+            return response
+        if type(response) is dict:
+            return response.get("data") or []
+        return []
+
+    def _fetch_local_list(self, path: str, site: str | None) -> Awaitable[list[dict[str, Any]]]:
+        """Fetch a list from a traditional site endpoint."""
+        return self._fetch_list(self._site_endpoint(path, site))
+
+    async def _fetch_integration_list(self, path: str, site: str | None) -> list[dict[str, Any]]:
+        """Fetch a list from an Integration API site endpoint."""
+        return await self._fetch_list(await self._integration_site_endpoint(path, site))
 
     async def _get_site_id(self, site_name: str | None = None) -> str:
         """Get the site UUID for the Integration API.
 
         The Integration API uses site UUIDs instead of site names.
 
+        One sites fetch fills the name -> UUID map for every site at once;
+        repeat misses are answered from the cached sites response, and
+        concurrent misses for the same site share one resolution.
+
         Args:
             site_name: Site name (defaults to configured site)
 
@@ -47,24 +186,38 @@ class UniFiNetworkClient(UniFiHTTPClient):
             UniFiNotFoundError: If site not found
         """
         site_name = site_name or self.site
+        key = site_name.lower()
 
         # Check cache first
-        if site_name in self._site_id_cache:
-            return self._site_id_cache[site_name]
+        site_id = self._site_id_cache.get(key)
+        if site_id is not None:
+            return site_id
+
+        return await self._single_flight(("site_id", key), lambda: self._resolve_site_id(site_name))
 
-        # Fetch sites and find matching one
+    async def _resolve_site_id(self, site_name: str) -> str:
+        """Fetch sites, map every name to its UUID and look up ``site_name``."""
+        key = site_name.lower()
         sites = await self.get_sites()
         for site in sites:
-            # Integration API uses 'internalReference' for site name
-            internal_ref = site.get("internalReference", site.get("name", ""))
-            name = site.get("name", "")
             site_id = site.get("id", "")
-
-            if site_name.lower() in (internal_ref.lower(), name.lower()):
-                self._site_id_cache[site_name] = site_id
-                return site_id
-
-        raise UniFiNotFoundError("Site", site_name)
+            name = site.get("name", "")
+            # Integration API uses 'internalReference' for site name
+            internal_ref = site.get("internalReference", name)
+            for alias in (internal_ref.lower(), name.lower()):
+                if alias:
+                    self._site_id_cache.setdefault(alias, site_id)
+
+        site_id = self._site_id_cache.get(key)
+        if site_id is None:
+            raise UniFiNotFoundError("Site", site_name)
+        return site_id
+
+    def invalidate_sites_cache(self) -> None:
+        """Forget cached sites and site UUIDs, e.g. after sites were changed."""
+        self._site_id_cache.clear()
+        self.invalidate_cache("/v1/sites")
+        self.invalidate_cache("/api/self/sites")
 
     def _site_endpoint(self, path: str, site: str | None = None) -> str:
         """Build a site-specific endpoint path for traditional API.
@@ -76,8 +229,7 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             Full endpoint path
         """
-        site = site or self.site
-        return f"/api/s/{site}/{path}"
+        return _site_path(site or self.site, path)
 
     async def _integration_site_endpoint(self, path: str, site: str | None = None) -> str:
         """Build a site-specific endpoint for Integration API.
@@ -90,24 +242,114 @@ class UniFiNetworkClient(UniFiHTTPClient):
             Full endpoint path with site UUID
         """
         site_id = await self._get_site_id(site)
-        return f"/v1/sites/{site_id}/{path}"
+        return _integration_path(site_id, path)
 
-    def _extract_list_data(self, response: dict | list) -> list[dict[str, Any]]:
-        """Extract list data from API response.
+    def _invalidate_after_command(self, endpoint: str, payload: Any) -> None:
+        """Drop only the cached lists a command can change.
 
-        Integration/Cloud APIs return paginated responses with 'data' field.
+        Read-only commands such as ``speedtest-status`` drop nothing.
+
+        Block/unblock also update the cached known-clients list in place, so
+        the new state is visible without refetching it.
+        """
+        cmd = payload.get("cmd") if type(payload) is dict else None
+        if cmd in _READ_ONLY_CMDS:
+            return
+
+        scope, _, manager = endpoint.partition("/cmd/")
+        paths = _CMD_INVALIDATES.get(manager)
+        if paths is None:
+            super()._invalidate_after_command(endpoint, payload)
+            return
+
+        if cmd in _BLOCK_CMDS and self._mark_blocked(scope, payload, _BLOCK_CMDS[cmd]):
+            # The known-clients list stays cached with the flag patched
+            paths = tuple(path for path in paths if path != "stat/alluser")
+
+        for path in paths:
+            self.invalidate_cache(f"{scope}/{path}")
+
+    def _mark_blocked(self, scope: str, payload: dict[str, Any], blocked: bool) -> bool:
+        """Set ``blocked`` on cached known-client records for a block command.
 
         Args:
-            response: API response
+            scope: Site endpoint prefix, e.g. ``/api/s/default``
+            payload: stamgr command body
+            blocked: New blocked state
 
         Returns:
-            List of data items
+            True if the cached known-clients list was updated
         """
-        if isinstance(response, list):
-            return response
-        if isinstance(response, dict):
-            return response.get("data", [])
-        return []
+        site = scope.rpartition("/")[2]
+        response = self.ctx.cache.get(_cache_key(self._site_endpoint("stat/alluser", site), None))
+        if type(response) is not dict or not response.get("data"):
+            return False
+
+        index = self._mac_index("all_clients", response["data"], site)
+        macs = payload.get("macs") or [payload.get("mac", "")]
+        for mac in macs:
+            client = index.get(_norm_mac(mac))
+            if client is None:
+                # Not in the cached list: refetch it rather than guess
+                return False
+            client["blocked"] = blocked
+        return True
+
+    def _is_cached(self, path: str, site: str | None = None) -> bool:
+        """Check whether a fresh response for a site list endpoint is cached."""
+        return _cache_key(self._site_endpoint(path, site), None) in self.ctx.cache
+
+    async def _get_by_mac(
+        self, path: str, mac: str, site: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch records for one MAC from a traditional ``{path}/{mac}`` endpoint.
+
+        Args:
+            path: Collection path, e.g. "stat/device"
+            mac: MAC address (any separator format)
+            site: Site name
+
+        Returns:
+            Matching records; empty if the controller rejected the lookup,
+            in which case callers fall back to scanning the full list
+        """
+        endpoint = self._site_endpoint(f"{path}/{_colon_mac(mac)}", site)
+        try:
+            response = await self.get(endpoint)
+        except UniFiAPIError as e:
+            # Older controllers 404 on the path; unknown MACs come back as an
+            # api.err payload (400, or 200 with rc=error)
+            if e.status_code in (200, 400, 404):
+                return []
+            raise
+        return response.get("data") or []
+
+    def _mac_index(
+        self, kind: str, items: list[dict[str, Any]], site: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Get a normalized-MAC lookup table for a fetched device/client list.
+
+        The index is kept in the shared cache next to the list it was built
+        from and reused for as long as the same (cached) list comes back, so
+        repeated lookups cost one dict probe instead of a scan.
+
+        Args:
+            kind: Which list the items came from (e.g. "devices")
+            items: Device or client dictionaries
+            site: Site name
+
+        Returns:
+            Mapping of normalized MAC to item
+        """
+        # Keyed under the site path so a site's commands also drop its indexes
+        key = (_site_path(site or self.site, ""), "mac_index", kind)
+        cached = self.ctx.cache.get(key)
+        if cached is not None and cached[0] is items:
+            return cached[1]
+
+        index = {_norm_mac(item.get("mac", "")): item for item in items}
+        self.ctx.cache[key] = (items, index)
+        return index
 
     # =========================================================================
     # Site Management
@@ -119,49 +361,90 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             List of site information dictionaries
         """
-        if self.is_cloud or self.is_integration_api:
-            # Cloud and Integration API use /v1/sites
-            response = await self.get("/v1/sites")
-            # These APIs return data directly or in simpler format
-            if isinstance(response, list):
-                return response
-            return response.get("data", response) if isinstance(response, dict) else []
+        return await self._list_fetchers["sites"](None)
 
-        response = await self.get("/api/self/sites")
-        return response.get("data", [])
-
-    async def get_site_health(self, site: str | None = None) -> list[dict[str, Any]]:
+    async def get_site_health(
+        self, site: str | None = None, devices: list[dict[str, Any]] | None = None
+    ) -> list[dict[str, Any]]:
         """Get health status for a site.
 
         Args:
             site: Site name (defaults to configured site)
+            devices: Already fetched device list; the Integration API derives
+                health from devices, so passing it avoids another fetch
 
         Returns:
             List of health status entries by subsystem
         """
-        if self.is_integration_api:
-            # Integration API doesn't have health endpoint
-            # Construct basic health from devices
+        if devices is not None and self.is_integration_api:
+            return await self._integration_health(site, devices)
+        return await self._list_fetchers["health"](site)
+
+    async def _integration_health(
+        self, site: str | None = None, devices: list[dict[str, Any]] | None = None
+    ) -> list[dict[str, Any]]:
+        """Build basic health from devices (Integration API has no health endpoint)."""
+        if devices is None:
             devices = await self.get_devices(site)
-            online = sum(1 for d in devices if d.get("state") == "ONLINE")
-            offline = len(devices) - online
-            return [{
-                "subsystem": "network",
-                "status": "ok" if offline == 0 else "degraded",
-                "devices_online": online,
-                "devices_offline": offline,
-                "note": "Limited health data available via Integration API",
-            }]
+        states = Counter(d.get("state") for d in devices)
+        online = states["ONLINE"]
+        offline = len(devices) - online
+        return [{
+            "subsystem": "network",
+            "status": "ok" if offline == 0 else "degraded",
+            "devices_online": online,
+            "devices_offline": offline,
+            "device_states": {str(state): count for state, count in states.items()},
+            "note": "Limited health data available via Integration API",
+        }]
+
+    async def _cloud_health(self, site: str | None = None) -> list[dict[str, Any]]:
+        """Build basic health from hosts (Cloud API has no health endpoint)."""
+        hosts = await self.get("/v1/hosts")
+        host_list = hosts.get("data", hosts) if type(hosts) is dict else hosts
+        return [{"subsystem": "wan", "status": "ok", "hosts": len(host_list) if type(host_list) is list else 0}]
+
+    async def get_site_snapshot(self, site: str | None = None) -> dict[str, Any]:
+        """Fetch devices, clients, networks, WLANs, sysinfo and health at once.
+
+        The requests run concurrently. A failing part is reported under
+        ``errors`` instead of failing the whole snapshot.
 
-        if self.is_cloud:
-            # Cloud API doesn't have direct health endpoint
-            hosts = await self.get("/v1/hosts")
-            host_list = hosts.get("data", hosts) if isinstance(hosts, dict) else hosts
-            return [{"subsystem": "wan", "status": "ok", "hosts": len(host_list) if isinstance(host_list, list) else 0}]
+        Args:
+            site: Site name
 
-        endpoint = self._site_endpoint("stat/health", site)
-        response = await self.get(endpoint)
-        return response.get("data", [])
+        Returns:
+            Dictionary with one key per part (None if it failed) and an
+            ``errors`` mapping of part name to error message
+        """
+        parts = {
+            "devices": self.get_devices(site),
+            "clients": self.get_clients(site),
+            "networks": self.get_networks(site),
+            "wlans": self.get_wlans(site),
+            "sysinfo": self.get_sysinfo(site),
+        }
+        if not self.is_integration_api:
+            parts["health"] = self.get_site_health(site)
+
+        results = await asyncio.gather(*parts.values(), return_exceptions=True)
+        snapshot: dict[str, Any] = dict(zip(parts, results, strict=True))
+
+        if self.is_integration_api:
+            # Health is derived from the devices fetched above
+            devices = snapshot["devices"]
+            snapshot["health"] = (
+                devices if isinstance(devices, BaseException)
+                else await self.get_site_health(site, devices=devices)
+            )
+
+        errors = {}
+        for name, value in snapshot.items():
+            if isinstance(value, BaseException):
+                errors[name] = str(value)
+                snapshot[name] = None
+        snapshot["errors"] = errors
+        return snapshot
 
     async def get_site_settings(self, site: str | None = None) -> list[dict[str, Any]]:
         """Get site settings.
@@ -203,21 +486,7 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             List of device information dictionaries
         """
-        if self.is_integration_api:
-            # Integration API uses site-specific endpoint
-            endpoint = await self._integration_site_endpoint("devices", site)
-            response = await self.get(endpoint)
-            return self._extract_list_data(response)
-
-        if self.is_cloud:
-            # Cloud API endpoint
-            response = await self.get("/v1/devices")
-            return self._extract_list_data(response)
-
-        # Traditional local API
-        endpoint = self._site_endpoint("stat/device", site)
-        response = await self.get(endpoint)
-        return response.get("data", [])
+        return await self._list_fetchers["devices"](site)
 
     async def get_devices_basic(self, site: str | None = None) -> list[dict[str, Any]]:
         """Get basic device information (faster, less data).
@@ -245,17 +514,37 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Raises:
             UniFiNotFoundError: If device not found
         """
-        devices = await self.get_devices(site)
-
-        # Normalize MAC for comparison
-        mac_normalized = mac.lower().replace(":", "").replace("-", "")
+        # A cached full list answers without any request; otherwise ask the
+        # controller for just this MAC
+        local = not (self.is_integration_api or self.is_cloud)
+        if local and not self._is_cached("stat/device", site):
+            devices = await self._get_by_mac("stat/device", mac, site)
+            if devices:
+                return devices[0]
+
+        mac_normalized = _norm_mac(mac)
+        device = (await self.get_devices_by_macs([mac], site))[mac_normalized]
+        if device is None:
+            raise UniFiNotFoundError("Device", mac)
+        return device
+
+    async def get_devices_by_macs(
+        self, macs: Iterable[str], site: str | None = None
+    ) -> dict[str, dict[str, Any] | None]:
+        """Get details for several devices with a single devices fetch.
 
-        for device in devices:
-            device_mac = device.get("mac", "").lower().replace(":", "")
-            if device_mac == mac_normalized:
-                return device
+        Args:
+            macs: Device MAC addresses (any separator format)
+            site: Site name
 
-        raise UniFiNotFoundError("Device", mac)
+        Returns:
+            Mapping of normalized MAC (lowercase, no separators) to device
+            information, or None for MACs that were not found
+        """
+        wanted = [_norm_mac(mac) for mac in macs]
+        devices = await self.get_devices(site)
+        index = self._mac_index("devices", devices, site)
+        return {mac: index.get(mac) for mac in wanted}
 
     async def restart_device(self, mac: str, site: str | None = None) -> dict[str, Any]:
         """Restart a device.
@@ -334,21 +623,7 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             List of connected client information
         """
-        if self.is_integration_api:
-            # Integration API uses site-specific endpoint
-            endpoint = await self._integration_site_endpoint("clients", site)
-            response = await self.get(endpoint)
-            return self._extract_list_data(response)
-
-        if self.is_cloud:
-            # Cloud API endpoint
-            response = await self.get("/v1/clients")
-            return self._extract_list_data(response)
-
-        # Traditional local API
-        endpoint = self._site_endpoint("stat/sta", site)
-        response = await self.get(endpoint)
-        return response.get("data", [])
+        return await self._list_fetchers["clients"](site)
 
     async def get_all_clients(self, site: str | None = None) -> list[dict[str, Any]]:
         """Get all known clients (including offline).
@@ -363,6 +638,25 @@ class UniFiNetworkClient(UniFiHTTPClient):
         response = await self.get(endpoint)
         return response.get("data", [])
 
+    async def iter_all_clients(
+        self, site: str | None = None, page_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all known clients (including offline), page by page.
+
+        Keeps memory bounded on sites with a long client history; the next
+        page is fetched while the current one is consumed.
+
+        Args:
+            site: Site name
+            page_size: Clients per request
+
+        Yields:
+            Client dictionaries
+        """
+        endpoint = self._site_endpoint("stat/alluser", site)
+        async for client in self._iter_pages(endpoint, page_size):
+            yield client
+
     async def get_configured_clients(self, site: str | None = None) -> list[dict[str, Any]]:
         """Get clients with fixed IP or other configurations.
 
@@ -389,24 +683,111 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Raises:
             UniFiNotFoundError: If client not found
         """
+        # A cached full list answers without any request; otherwise ask the
+        # controller for just this MAC
+        local = not (self.is_integration_api or self.is_cloud)
+        if local and not self._is_cached("stat/sta", site):
+            clients = await self._get_by_mac("stat/sta", mac, site)
+            if clients:
+                return clients[0]
+
+        mac_normalized = _norm_mac(mac)
+        client = (await self.get_clients_by_macs([mac], site))[mac_normalized]
+        if client is None:
+            raise UniFiNotFoundError("Client", mac)
+        return client
+
+    async def get_clients_by_macs(
+        self, macs: Iterable[str], site: str | None = None
+    ) -> dict[str, dict[str, Any] | None]:
+        """Get details for several clients with at most two list fetches.
+
+        Connected clients are checked first; the known-clients list is only
+        fetched when some MACs are not currently connected.
+
+        Args:
+            macs: Client MAC addresses (any separator format)
+            site: Site name
+
+        Returns:
+            Mapping of normalized MAC (lowercase, no separators) to client
+            information, or None for MACs that were not found
+        """
+        wanted = [_norm_mac(mac) for mac in macs]
+
         # First check connected clients
         clients = await self.get_clients(site)
+        index = self._mac_index("clients", clients, site)
+        result = {mac: index.get(mac) for mac in wanted}
 
-        mac_normalized = mac.lower().replace(":", "").replace("-", "")
+        # Then check all known clients for the rest
+        missing = [mac for mac, client in result.items() if client is None]
+        if missing:
+            all_clients = await self.get_all_clients(site)
+            index = self._mac_index("all_clients", all_clients, site)
+            for mac in missing:
+                result[mac] = index.get(mac)
 
-        for client in clients:
-            client_mac = client.get("mac", "").lower().replace(":", "")
-            if client_mac == mac_normalized:
-                return client
+        return result
 
-        # Then check all known clients
-        all_clients = await self.get_all_clients(site)
-        for client in all_clients:
-            client_mac = client.get("mac", "").lower().replace(":", "")
-            if client_mac == mac_normalized:
-                return client
+    async def _stamgr_cmd(
+        self, cmd: str, macs: Iterable[str], site: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Send a station-manager command for one or more clients.
 
-        raise UniFiNotFoundError("Client", mac)
+        ``forget-sta`` takes several MACs in one request; the other
+        commands accept a single MAC each, so those requests are sent
+        concurrently. A single MAC is always sent as ``{"cmd", "mac"}``.
+
+        Args:
+            cmd: stamgr command (e.g. "block-sta")
+            macs: Client MAC addresses
+            site: Site name
+
+        Returns:
+            Command results, one per request sent
+        """
+        macs = [mac.lower() for mac in macs]
+        if not macs:
+            return []
+        endpoint = self._site_endpoint("cmd/stamgr", site)
+        if cmd in _STAMGR_BATCH_CMDS and len(macs) > 1:
+            return [await self.post(endpoint, json={"cmd": cmd, "macs": macs})]
+        return list(await asyncio.gather(
+            *(self.post(endpoint, json={"cmd": cmd, "mac": mac}) for mac in macs)
+        ))
+
+    async def _stamgr_bulk(
+        self, cmd: str, macs: Iterable[str], site: str | None = None
+    ) -> dict[str, bool]:
+        """Run a stamgr command for several clients and report per-MAC success.
+
+        A MAC the controller rejects is reported as False without failing
+        the others; connection and auth errors still raise.
+        """
+        macs = list(macs)
+        if not macs:
+            return {}
+        if cmd in _STAMGR_BATCH_CMDS and len(macs) > 1:
+            try:
+                (result,) = await self._stamgr_cmd(cmd, macs, site)
+            except UniFiAPIError:
+                return dict.fromkeys(macs, False)
+            ok: bool = result.get("meta", {}).get("rc") == "ok"
+            return dict.fromkeys(macs, ok)
+
+        results = await asyncio.gather(
+            *(self._stamgr_cmd(cmd, [mac], site) for mac in macs), return_exceptions=True
+        )
+        status: dict[str, bool] = {}
+        for mac, result in zip(macs, results, strict=True):
+            if isinstance(result, UniFiAPIError):
+                status[mac] = False
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                status[mac] = result[0].get("meta", {}).get("rc") == "ok"
+        return status
 
     async def block_client(self, mac: str, site: str | None = None) -> dict[str, Any]:
         """Block a client from the network.
@@ -418,10 +799,21 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             Command result
         """
-        endpoint = self._site_endpoint("cmd/stamgr", site)
-        payload = {"cmd": "block-sta", "mac": mac.lower()}
-        response = await self.post(endpoint, json=payload)
-        return response
+        return (await self._stamgr_cmd("block-sta", [mac], site))[0]
+
+    async def block_clients(
+        self, macs: Iterable[str], site: str | None = None
+    ) -> dict[str, bool]:
+        """Block several clients from the network.
+
+        Args:
+            macs: Client MAC addresses
+            site: Site name
+
+        Returns:
+            Mapping of MAC to whether the command succeeded
+        """
+        return await self._stamgr_bulk("block-sta", macs, site)
 
     async def unblock_client(self, mac: str, site: str | None = None) -> dict[str, Any]:
         """Unblock a previously blocked client.
@@ -433,10 +825,21 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             Command result
         """
-        endpoint = self._site_endpoint("cmd/stamgr", site)
-        payload = {"cmd": "unblock-sta", "mac": mac.lower()}
-        response = await self.post(endpoint, json=payload)
-        return response
+        return (await self._stamgr_cmd("unblock-sta", [mac], site))[0]
+
+    async def unblock_clients(
+        self, macs: Iterable[str], site: str | None = None
+    ) -> dict[str, bool]:
+        """Unblock several previously blocked clients.
+
+        Args:
+            macs: Client MAC addresses
+            site: Site name
+
+        Returns:
+            Mapping of MAC to whether the command succeeded
+        """
+        return await self._stamgr_bulk("unblock-sta", macs, site)
 
     async def kick_client(self, mac: str, site: str | None = None) -> dict[str, Any]:
         """Disconnect a client (they can reconnect).
@@ -448,10 +851,21 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             Command result
         """
-        endpoint = self._site_endpoint("cmd/stamgr", site)
-        payload = {"cmd": "kick-sta", "mac": mac.lower()}
-        response = await self.post(endpoint, json=payload)
-        return response
+        return (await self._stamgr_cmd("kick-sta", [mac], site))[0]
+
+    async def kick_clients(
+        self, macs: Iterable[str], site: str | None = None
+    ) -> dict[str, bool]:
+        """Disconnect several clients (they can reconnect).
+
+        Args:
+            macs: Client MAC addresses
+            site: Site name
+
+        Returns:
+            Mapping of MAC to whether the command succeeded
+        """
+        return await self._stamgr_bulk("kick-sta", macs, site)
 
     async def forget_client(self, mac: str, site: str | None = None) -> dict[str, Any]:
         """Remove a client from the known clients list.
@@ -463,10 +877,21 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             Command result
         """
-        endpoint = self._site_endpoint("cmd/stamgr", site)
-        payload = {"cmd": "forget-sta", "mac": mac.lower()}
-        response = await self.post(endpoint, json=payload)
-        return response
+        return (await self._stamgr_cmd("forget-sta", [mac], site))[0]
+
+    async def forget_clients(
+        self, macs: Iterable[str], site: str | None = None
+    ) -> dict[str, bool]:
+        """Remove several clients from the known clients list in one request.
+
+        Args:
+            macs: Client MAC addresses
+            site: Site name
+
+        Returns:
+            Mapping of MAC to whether the command succeeded
+        """
+        return await self._stamgr_bulk("forget-sta", macs, site)
 
     # =========================================================================
     # Statistics & Events
@@ -493,6 +918,102 @@ class UniFiNetworkClient(UniFiHTTPClient):
         response = await self.get(endpoint, params=params)
         return response.get("data", [])
 
+    async def iter_events(
+        self, total: int, page_size: int = 3000, site: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over up to ``total`` recent events, page by page.
+
+        While the caller consumes one page the next one is already being
+        fetched, so network latency overlaps with processing. At most one
+        page request is in flight at a time. Pages bypass the response cache:
+        caching them would fill it with fragments, and a later walk could
+        stitch stale early pages onto fresh ones whose offsets have shifted.
+
+        Args:
+            total: Maximum number of events to yield
+            page_size: Events per request (max 3000)
+            site: Site name
+
+        Yields:
+            Event dictionaries, newest first
+        """
+        if self.is_integration_api or total <= 0:
+            # Integration API doesn't support events endpoint
+            return
+
+        endpoint = self._site_endpoint("stat/event", site)
+        async for event in self._iter_pages(endpoint, min(page_size, 3000), total):
+            yield event
+
+    async def _iter_pages(
+        self, endpoint: str, page_size: int, total: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Walk a ``_start``/``_limit`` paged list, prefetching the next page.
+
+        While the caller consumes one page the next one is already being
+        fetched, so network latency overlaps with processing. At most one
+        page request is in flight at a time.
+
+        Args:
+            endpoint: Site list endpoint that accepts ``_start``/``_limit``
+            page_size: Items per request
+            total: Maximum number of items to yield (None for all)
+
+        Yields:
+            List items in controller order
+        """
+        def fetch(start: int) -> asyncio.Task[Any]:
+            limit = page_size if total is None else min(page_size, total - start)
+            params = {"_start": start, "_limit": limit}
+            return asyncio.create_task(self.request("GET", endpoint, params=params))
+
+        start = 0
+        previous: list[dict[str, Any]] = []
+        task: asyncio.Task[Any] | None = fetch(start)
+        try:
+            while task is not None:
+                page = (await task).get("data", [])
+                # Controllers that ignore _start keep returning the first page
+                if start and page[:1] == previous[:1]:
+                    break
+                start += len(page)
+                # A short page means the list is exhausted; an oversized one
+                # means the controller ignored _limit and sent everything
+                more = len(page) == page_size and (total is None or start < total)
+                task = fetch(start) if more else None
+                if total is not None and start > total:
+                    page = page[: len(page) - (start - total)]
+                previous = page
+                for item in page:
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def stream_events(
+        self, limit: int = 3000, site: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream recent events without buffering the whole response.
+
+        Parses incrementally when the optional ijson package is installed
+        (``unifi-mcp[speedups]``).
+
+        Args:
+            limit: Maximum number of events to return (max 3000)
+            site: Site name
+
+        Yields:
+            Event dictionaries, newest first
+        """
+        if self.is_integration_api:
+            # Integration API doesn't support events endpoint
+            return
+
+        endpoint = self._site_endpoint("stat/event", site)
+        params = {"_limit": min(limit, 3000)}
+        async for event in self.stream_items(endpoint, params=params):
+            yield event
+
     async def get_alarms(self, site: str | None = None) -> list[dict[str, Any]]:
         """Get active alarms.
 
@@ -604,15 +1125,7 @@ class UniFiNetworkClient(UniFiHTTPClient):
         Returns:
             List of network configuration dictionaries
         """
-        if self.is_integration_api:
-            # Integration API uses site-specific endpoint
-            endpoint = await self._integration_site_endpoint("networks", site)
-            response = await self.get(endpoint)
-            return self._extract_list_data(response)
-
-        endpoint = self._site_endpoint("rest/networkconf", site)
-        response = await self.get(endpoint)
-        return response.get("data", [])
+        return await self._list_fetchers["networks"](site)
 
     async def get_wlans(self, site: str | None = None) -> list[dict[str, Any]]:
         """Get wireless network configurations.
@@ -658,6 +1171,28 @@ class UniFiNetworkClient(UniFiHTTPClient):
         response = await self.get(endpoint)
         return response.get("data", [])
 
+    async def get_config_bundle(self, site: str | None = None) -> ConfigBundle:
+        """Get networks, WLANs, port profiles, firewall rules and routes at once.
+
+        Args:
+            site: Site name
+
+        Returns:
+            ConfigBundle; parts that failed are empty and listed in ``errors``
+        """
+        endpoints = [self._site_endpoint(path, site) for path in _CONFIG_BUNDLE_PATHS.values()]
+        responses = await self.batch_get(endpoints)
+
+        parts: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for name, response in zip(_CONFIG_BUNDLE_PATHS, responses, strict=True):
+            if isinstance(response, BaseException):
+                errors[name] = str(response)
+                parts[name] = []
+            else:
+                parts[name] = response.get("data") or []
+        return ConfigBundle(**parts, errors=errors)
+
     async def get_routing(self, site: str | None = None) -> list[dict[str, Any]]:
         """Get routing table.
 
@@ -1,12 +1,32 @@
 """UniFi Protect API client."""
 
-import base64
+import asyncio
 import logging
 import time
-from typing import Any
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import lru_cache
+from typing import Any, TypeVar
 
 import httpx
+import orjson
 
+try:
+    import ijson
+except ImportError:  # optional: pip install unifi-mcp[speedups]
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: pip install unifi-mcp[speedups]
+    msgspec = None
+
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # optional: pip install unifi-mcp[speedups]
+    from base64 import b64encode as _b64encode
+
+from unifi_mcp.clients.base import _AsyncByteReader, _cache_key, _release_inflight
 from unifi_mcp.config import UniFiDevice
 from unifi_mcp.exceptions import (
     UniFiAPIError,
@@ -17,6 +37,100 @@ from unifi_mcp.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Streamed body chunk size; a multiple of 3 keeps base64 chunks aligned
+_STREAM_CHUNK = 3 * 16384
+
+# How long listing responses (cameras, lights, ...) are reused, in seconds
+LISTING_TTL = 3.0
+
+# Default lifetime of the camera ID -> name map used to label events, in seconds
+CAMERA_NAMES_TTL = 30.0
+
+# How long a snapshot is served to repeat requests, and how many are kept
+SNAPSHOT_TTL = 1.0
+_SNAPSHOT_CACHE_SIZE = 16
+
+# Default number of snapshots requested at once; the NVR transcodes each one
+SNAPSHOT_CONCURRENCY = 4
+
+
+@lru_cache(maxsize=512)
+def _protect_url(base_url: str, endpoint: str) -> httpx.URL:
+    """Parse (once) the absolute URL for a Protect endpoint.
+
+    httpx re-parses string URLs on every request; a prebuilt ``httpx.URL``
+    is reused as-is.
+    """
+    return httpx.URL(f"{base_url}{endpoint}")
+
+
+async def _b64encode_stream(chunks: AsyncIterator[bytes]) -> str:
+    """Base64-encode a streamed body without holding the raw body in full."""
+    # base64 works on 3-byte groups, so carry any remainder forward
+    out = bytearray()
+    pending = b""
+    async for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        cut = len(chunk) - len(chunk) % 3
+        out += _b64encode(memoryview(chunk)[:cut])
+        pending = chunk[cut:]
+    if pending:
+        out += _b64encode(pending)
+    return out.decode("ascii")
+
+
+def _now_ms() -> int:
+    """Current epoch time in integer milliseconds, without a float round-trip."""
+    return time.time_ns() // 1_000_000
+
+
+@lru_cache(maxsize=32)
+def _join_csv(values: tuple[str, ...]) -> str:
+    """Join an event filter (camera IDs or types) into its query-string form."""
+    return ",".join(values)
+
+
+@lru_cache(maxsize=64)
+def _is_session_cookie(name: str) -> bool:
+    """Whether a cookie name looks like a UniFi OS session or CSRF token."""
+    upper = name.upper()
+    return "TOKEN" in upper or "CSRF" in upper
+
+
+@lru_cache(maxsize=16)
+def _projection_decoder(fields: tuple[str, ...]) -> Any:
+    """Build (once) a msgspec decoder for a JSON array keeping only ``fields``.
+
+    Keys outside ``fields`` are skipped by the C decoder without ever
+    becoming Python objects.
+    """
+    if msgspec is None:
+        raise ImportError("msgspec is not installed")
+    projection = msgspec.defstruct("Projection", [(f, Any, None) for f in fields])
+    return msgspec.json.Decoder(list[projection])
+
+
+# Camera fields the summary tools read; the rest of each record is skipped
+_CAMERA_SUMMARY_FIELDS = (
+    "id", "name", "state", "type", "modelKey", "mac", "isMicEnabled", "isRecording",
+)
+
+# How event times are shown in recent-activity listings (local time)
+_EVENT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Smart detection types broken out in event summaries (in output order)
+_SMART_DETECT_TYPES = ("person", "vehicle", "animal", "package")
+_SMART_DETECT_SET = frozenset(_SMART_DETECT_TYPES)
+
+# Event queries use epoch milliseconds
+_HOUR_MS = 3_600_000
+
+# Protect hosts whose negotiated HTTP version has already been logged
+_logged_http_versions: set[str] = set()
+
 
 class UniFiProtectClient:
     """Client for UniFi Protect API.
@@ -31,43 +145,74 @@ class UniFiProtectClient:
     credentials are configured.
     """
 
+    # A client is built per tool call; slots keep instances small and cheap
+    __slots__ = (
+        "client",
+        "device",
+        "base_url",
+        "internal_base_url",
+        "_owns_client",
+        "_csrf_token",
+        "_session_authenticated",
+        "_cache",
+        "_inflight",
+        "_snapshots",
+        "_headers",
+        "_session_headers",
+        "_names_ttl",
+    )
+
     def __init__(
         self,
         client: httpx.AsyncClient,
         device: UniFiDevice,
+        cache: dict[Any, tuple[float, Any, str | None]] | None = None,
+        owns_client: bool = False,
+        inflight: dict[Any, asyncio.Task[Any]] | None = None,
+        snapshots: dict[Any, tuple[float, Any]] | None = None,
+        names_ttl: float = CAMERA_NAMES_TTL,
     ):
         """Initialize the Protect API client.
 
         Args:
-            client: httpx AsyncClient instance
+            client: httpx AsyncClient instance. Normally this is the
+                application-wide pool created by the server lifespan.
             device: UniFi device configuration
+            cache: Listing cache to share between client instances; a
+                private one is used if omitted
+            owns_client: Close ``client`` in aclose(). Leave False when the
+                pool is shared, as the lifespan tears it down at shutdown.
+            inflight: Map of in-flight listing fetches to share between
+                client instances, so concurrent callers coalesce onto one
+                request; a private one is used if omitted
+            snapshots: Recent-snapshot cache to share between client
+                instances, so polling callers reuse an image for
+                SNAPSHOT_TTL seconds; a private one is used if omitted
+            names_ttl: Seconds the camera ID -> name map used to label
+                events is reused
         """
         self.client = client
+        self._owns_client = owns_client
         self.device = device
         self.base_url = device.protect_api_base
         self.internal_base_url = device.protect_internal_api_base
         self._csrf_token: str | None = None
         self._session_authenticated = False
-
-    @property
-    def _headers(self) -> dict[str, str]:
-        """Get headers for Integration API requests."""
-        return {
+        self._cache = cache if cache is not None else {}
+        self._inflight = inflight if inflight is not None else {}
+        self._snapshots = snapshots if snapshots is not None else {}
+        self._names_ttl = names_ttl
+        # Integration API headers never change for a client, so build them once
+        self._headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
-            "X-API-KEY": self.device.api_key,
+            "X-API-KEY": device.api_key,
         }
-
-    @property
-    def _session_headers(self) -> dict[str, str]:
-        """Get headers for session-authenticated requests."""
-        headers = {
+        # Session headers only change when a login hands out a new CSRF token
+        self._session_headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
-        if self._csrf_token:
-            headers["X-CSRF-Token"] = self._csrf_token
-        return headers
 
     async def _ensure_session_auth(self) -> None:
         """Ensure session authentication is established.
@@ -83,10 +228,9 @@ class UniFiProtectClient:
 
         # Check if the shared HTTP client already has session cookies
         # (e.g., from lifespan session auth in base.py)
-        auth_cookies = [c for c in self.client.cookies.jar if "TOKEN" in c.name.upper() or "CSRF" in c.name.upper()]
-        if auth_cookies:
+        if any(_is_session_cookie(c.name) for c in self.client.cookies.jar):
             self._session_authenticated = True
-            logger.info("Reusing existing session authentication for Protect")
+            logger.debug("Reusing existing session authentication for Protect")
             return
 
         if not self.device.has_protect_credentials:
@@ -95,7 +239,7 @@ class UniFiProtectClient:
                 "Add 'username' and 'password' to your device configuration."
             )
 
-        auth_url = f"{self.device.url.rstrip('/')}/api/auth/login"
+        auth_url = self.device.auth_url
         payload = {
             "username": self.device.username,
             "password": self.device.password,
@@ -109,17 +253,64 @@ class UniFiProtectClient:
             )
         except httpx.ConnectError as e:
             raise UniFiConnectionError(f"Failed to connect for auth: {e}") from e
+        except httpx.TimeoutException as e:
+            raise UniFiConnectionError(f"Auth request timed out: {e}") from e
 
         if response.status_code == 200:
             self._session_authenticated = True
             if "X-CSRF-Token" in response.headers:
                 self._csrf_token = response.headers["X-CSRF-Token"]
+                self._session_headers = {
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                    "X-CSRF-Token": self._csrf_token,
+                }
             logger.info("Session authentication established for Protect")
         elif response.status_code == 401:
             raise UniFiAuthError("Invalid username or password for Protect")
         else:
             raise UniFiAuthError(f"Protect auth failed with status {response.status_code}")
 
+    async def warmup(self) -> None:
+        """Establish the session ahead of the first events/recordings call.
+
+        Meant to run as a background task at startup. Only the session
+        cookies outlive this call: they land in the shared HTTP client, so
+        later clients reuse them instead of logging in on the request path.
+        The CSRF token is kept on this instance only, so later clients
+        reusing the cookies send no X-CSRF-Token, as with any cookie reuse.
+        Failures are logged, not raised; the first real call will retry and
+        surface the error.
+        """
+        if not self.device.has_protect_credentials:
+            return
+        try:
+            await self._ensure_session_auth()
+        except (UniFiAuthError, UniFiConnectionError, httpx.HTTPError) as e:
+            logger.warning(f"Protect session warmup failed for {self.device.name}: {e}")
+
+    async def aclose(self) -> None:
+        """Release the HTTP client if this instance owns it."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "UniFiProtectClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _send(
+        self, method: str, url: httpx.URL, headers: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, turning transport failures into UniFiConnectionError."""
+        try:
+            return await self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.ConnectError as e:
+            raise UniFiConnectionError(f"Failed to connect to Protect: {e}") from e
+        except httpx.TimeoutException as e:
+            raise UniFiConnectionError(f"Request timed out: {e}") from e
+
     async def _request(
         self,
         method: str,
@@ -140,36 +331,219 @@ class UniFiProtectClient:
             UniFiConnectionError: If connection fails
             UniFiAPIError: For API errors
         """
-        url = f"{self.base_url}{endpoint}"
+        url = _protect_url(self.base_url, endpoint)
+        extra_headers = kwargs.pop("headers", None)
+        headers = {**self._headers, **extra_headers} if extra_headers else self._headers
+
+        response = await self._send(method, url, headers, **kwargs)
+
+        if self.base_url not in _logged_http_versions:
+            # The shared pool offers HTTP/2; record once what the NVR agreed to
+            _logged_http_versions.add(self.base_url)
+            logger.debug(f"Protect at {self.base_url} negotiated {response.http_version}")
+
+        self._raise_for_status(response, endpoint)
+
+        if method != "GET":
+            self._invalidate()
+
+        return response
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, endpoint: str) -> None:
+        """Raise the matching UniFi error for an error response.
+
+        Raises:
+            UniFiNotFoundError: For 404
+            UniFiAPIError: For other error statuses
+        """
+        status = response.status_code
+        if status < 400:
+            return
+        if status == 401:
+            raise UniFiAPIError("Authentication failed", 401)
+        if status == 404:
+            raise UniFiNotFoundError("Resource", endpoint)
+        # Slice before decoding so a huge error page isn't decoded in full
+        body = response.content[:200].decode("utf-8", errors="replace")
+        raise UniFiAPIError(f"API error: {body}", status)
+
+    async def _stream_binary(
+        self,
+        endpoint: str,
+        chunk_size: int = _STREAM_CHUNK,
+        internal: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Make a GET request and yield the body in chunks as it arrives.
+
+        Args:
+            endpoint: API endpoint
+            chunk_size: Preferred chunk size in bytes
+            internal: Use the session-authenticated internal API; an expired
+                session is renewed and the request retried once
+            **kwargs: Additional arguments for httpx
+
+        Yields:
+            Body chunks
+
+        Raises:
+            UniFiAuthError: If internal credentials are not configured
+            UniFiConnectionError: If connection fails
+            UniFiAPIError: For API errors
+        """
+        if internal:
+            await self._ensure_session_auth()
+            url = _protect_url(self.internal_base_url, endpoint)
+        else:
+            url = _protect_url(self.base_url, endpoint)
 
         try:
-            response = await self.client.request(
-                method,
-                url,
-                headers=self._headers,
-                **kwargs,
-            )
+            for attempt in range(2 if internal else 1):
+                headers = self._session_headers if internal else self._headers
+                async with self.client.stream("GET", url, headers=headers, **kwargs) as response:
+                    if response.status_code == 401 and internal and attempt == 0:
+                        # Session may have expired, re-auth and try again
+                        self._session_authenticated = False
+                        await self._ensure_session_auth()
+                        continue
+                    if response.status_code >= 400:
+                        await response.aread()
+                        self._raise_for_status(response, endpoint)
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        yield chunk
+                    return
         except httpx.ConnectError as e:
             raise UniFiConnectionError(f"Failed to connect to Protect: {e}") from e
         except httpx.TimeoutException as e:
             raise UniFiConnectionError(f"Request timed out: {e}") from e
 
-        if response.status_code == 401:
-            raise UniFiAPIError("Authentication failed", 401)
-        if response.status_code == 404:
-            raise UniFiNotFoundError("Resource", endpoint)
-        if response.status_code >= 400:
-            raise UniFiAPIError(
-                f"API error: {response.text[:200]}",
-                response.status_code,
+    async def _single_flight(self, key: tuple[Any, ...], factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory()`` once for all concurrent callers using the same key.
+
+        Args:
+            key: Identifies the shared work (namespaced into the in-flight map)
+            factory: Creates the coroutine to run when nothing is in flight
+
+        Returns:
+            The result of the shared work
+        """
+        flight_key = ("protect", *key)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[flight_key] = task
+            task.add_done_callback(
+                lambda t: _release_inflight(self._inflight, flight_key, t)
             )
 
-        return response
+        # Shield so one caller being cancelled doesn't cancel the shared work
+        return await asyncio.shield(task)
 
     async def _get(self, endpoint: str, **kwargs: Any) -> Any:
-        """Make a GET request and return JSON."""
+        """Make a GET request and return JSON.
+
+        Identical concurrent GETs (same endpoint and params) share one request.
+        """
+        if set(kwargs) <= {"params"}:
+            key = (self.base_url, *_cache_key(endpoint, kwargs.get("params")))
+            return await self._single_flight(key, lambda: self._get_uncoalesced(endpoint, **kwargs))
+        return await self._get_uncoalesced(endpoint, **kwargs)
+
+    async def _get_uncoalesced(self, endpoint: str, **kwargs: Any) -> Any:
+        """Make a GET request and return JSON, without coalescing."""
         response = await self._request("GET", endpoint, **kwargs)
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def _cached_get(self, endpoint: str, ttl: float = LISTING_TTL) -> Any:
+        """Make a GET request, reusing a response younger than ``ttl`` seconds.
+
+        Args:
+            endpoint: API endpoint
+            ttl: Maximum age of a reused response
+
+        Returns:
+            Parsed JSON response
+        """
+        key = (self.base_url, endpoint)
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        # Callers that miss while a fetch is running wait for that fetch
+        return await self._single_flight(key, lambda: self._fetch_listing(key, endpoint))
+
+    async def _fetch_listing(self, key: tuple[str, str], endpoint: str) -> Any:
+        """Fetch a listing and store it in the listing cache.
+
+        An expired entry's ETag is sent as ``If-None-Match``; on 304 the
+        cached data is kept without downloading or parsing it again.
+        """
+        entry = self._cache.get(key)
+        etag = entry[2] if entry is not None else None
+        headers = {"If-None-Match": etag} if etag else None
+
+        response = await self._request("GET", endpoint, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            data = entry[1]
+        else:
+            data = orjson.loads(response.content)
+        self._cache[key] = (time.monotonic(), data, response.headers.get("etag", etag))
+        return data
+
+    async def _project_listing(
+        self, endpoint: str, fields: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        """Get a listing reduced to ``fields``, skipping the rest when possible.
+
+        A cached or in-flight listing is reused. Otherwise, with msgspec
+        installed, the body is decoded straight into the requested fields;
+        with only ijson, items are decoded one at a time. Either way large
+        per-item blobs are never held at once. These reads do not populate
+        the listing cache.
+
+        Args:
+            endpoint: API endpoint returning a JSON array
+            fields: Keys to keep from each item
+
+        Returns:
+            One dict per item with just ``fields``
+        """
+        key = (self.base_url, endpoint)
+        entry = self._cache.get(key)
+        fresh = entry is not None and time.monotonic() - entry[0] < LISTING_TTL
+        lean = msgspec is not None or ijson is not None
+        if fresh or not lean or ("protect", *key) in self._inflight:
+            items = await self._cached_get(endpoint)
+            return [{k: item.get(k) for k in fields} for item in items]
+
+        return await self._single_flight(
+            (*key, fields), lambda: self._fetch_projection(endpoint, fields)
+        )
+
+    async def _fetch_projection(
+        self, endpoint: str, fields: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        """Fetch a listing keeping only ``fields``, with msgspec or ijson if installed."""
+        if msgspec is not None:
+            response = await self._request("GET", endpoint)
+            decoded = _projection_decoder(fields).decode(response.content)
+            return [msgspec.structs.asdict(item) for item in decoded]
+
+        if ijson is not None:
+            reader = _AsyncByteReader(self._stream_binary(endpoint))
+            return [
+                {k: item.get(k) for k in fields}
+                async for item in ijson.items(reader, "item", use_float=True)
+            ]
+
+        response = await self._request("GET", endpoint)
+        return [{k: item.get(k) for k in fields} for item in orjson.loads(response.content)]
+
+    def _invalidate(self) -> None:
+        """Drop this NVR's cached listings (after a state-changing request)."""
+        for key in [k for k in self._cache if k[0] == self.base_url]:
+            del self._cache[key]
 
     async def _get_binary(self, endpoint: str, **kwargs: Any) -> bytes:
         """Make a GET request and return binary data."""
@@ -186,7 +560,7 @@ class UniFiProtectClient:
         Returns:
             List of camera information dictionaries
         """
-        return await self._get("/cameras")
+        return await self._cached_get("/cameras")
 
     async def get_camera(self, camera_id: str) -> dict[str, Any]:
         """Get details for a specific camera.
@@ -206,7 +580,8 @@ class UniFiProtectClient:
         """Get a camera by name.
 
         Args:
-            name: Camera name (case-insensitive partial match)
+            name: Camera name (case-insensitive; exact match preferred,
+                otherwise the first partial match)
 
         Returns:
             Camera information dictionary
@@ -215,14 +590,83 @@ class UniFiProtectClient:
             UniFiNotFoundError: If camera not found
         """
         cameras = await self.get_cameras()
+        _, exact, names = self._camera_name_index(cameras)
         name_lower = name.lower()
 
-        for camera in cameras:
-            if name_lower in camera.get("name", "").lower():
+        camera = exact.get(name_lower)
+        if camera is not None:
+            return camera
+
+        for camera_name, camera in names:
+            if name_lower in camera_name:
                 return camera
 
         raise UniFiNotFoundError("Camera", name)
 
+    async def find_camera(self, camera: str) -> dict[str, Any]:
+        """Find a camera by ID or name, preferring the cached listing.
+
+        Tools accept either form; resolving against the (shared, coalesced)
+        cameras listing avoids a per-camera request that 404s whenever a
+        name is passed.
+
+        Args:
+            camera: Camera ID, or name as accepted by get_camera_by_name
+
+        Returns:
+            Camera information dictionary
+
+        Raises:
+            UniFiNotFoundError: If camera not found
+        """
+        cameras = await self.get_cameras()
+        by_id, exact, names = self._camera_name_index(cameras)
+        found = by_id.get(camera) or exact.get(camera.lower())
+        if found is not None:
+            return found
+
+        name_lower = camera.lower()
+        for camera_name, found in names:
+            if name_lower in camera_name:
+                return found
+
+        # Not in the listing (e.g. added since it was fetched): ask directly
+        try:
+            return await self.get_camera(camera)
+        except UniFiNotFoundError:
+            raise UniFiNotFoundError("Camera", camera) from None
+
+    def _camera_name_index(self, cameras: list[dict[str, Any]]) -> tuple[
+        dict[str, dict[str, Any]],
+        dict[str, dict[str, Any]],
+        list[tuple[str, dict[str, Any]]],
+    ]:
+        """Get ID and lower-cased name lookups for a cameras listing.
+
+        Built once per fetched listing and kept next to it in the cache.
+
+        Args:
+            cameras: Cameras listing
+
+        Returns:
+            ID mapping, exact-name mapping (first camera wins) and
+            (name, camera) pairs in listing order for substring matching
+        """
+        key = (self.base_url, "camera_names")
+        entry = self._cache.get(key)
+        if entry is not None and entry[1][0] is cameras:
+            return entry[1][1]
+
+        names = [(c.get("name", "").lower(), c) for c in cameras]
+        exact: dict[str, dict[str, Any]] = {}
+        for camera_name, camera in names:
+            if camera_name:
+                exact.setdefault(camera_name, camera)
+        by_id = {c["id"]: c for c in cameras if c.get("id")}
+        index = (by_id, exact, names)
+        self._cache[key] = (time.monotonic(), (cameras, index), None)
+        return index
+
     async def get_camera_snapshot(
         self,
         camera_id: str,
@@ -239,13 +683,16 @@ class UniFiProtectClient:
         Returns:
             JPEG image bytes
         """
-        params = {}
-        if width:
-            params["w"] = width
-        if height:
-            params["h"] = height
+        key = (self.base_url, camera_id, width, height, "jpeg")
+        image = self._recent_snapshot(key)
+        if image is not None:
+            return image
+
+        params = {k: v for k, v in (("w", width), ("h", height)) if v}
 
-        return await self._get_binary(f"/cameras/{camera_id}/snapshot", params=params)
+        image = await self._get_binary(f"/cameras/{camera_id}/snapshot", params=params)
+        self._store_snapshot(key, image)
+        return image
 
     async def get_camera_snapshot_base64(
         self,
@@ -263,8 +710,61 @@ class UniFiProtectClient:
         Returns:
             Base64-encoded JPEG image
         """
-        image_bytes = await self.get_camera_snapshot(camera_id, width, height)
-        return base64.b64encode(image_bytes).decode("utf-8")
+        key = (self.base_url, camera_id, width, height, "base64")
+        encoded = self._recent_snapshot(key)
+        if encoded is not None:
+            return encoded
+        image = self._recent_snapshot(key[:-1] + ("jpeg",))
+        if image is not None:
+            return _b64encode(image).decode("ascii")
+
+        params = {k: v for k, v in (("w", width), ("h", height)) if v}
+
+        encoded = await _b64encode_stream(
+            self._stream_binary(f"/cameras/{camera_id}/snapshot", params=params)
+        )
+        self._store_snapshot(key, encoded)
+        return encoded
+
+    async def get_snapshots(
+        self,
+        camera_ids: list[str],
+        width: int | None = None,
+        height: int | None = None,
+        concurrency: int = SNAPSHOT_CONCURRENCY,
+    ) -> dict[str, bytes]:
+        """Get snapshots from several cameras concurrently.
+
+        Args:
+            camera_ids: Camera IDs
+            width: Optional width for resizing
+            height: Optional height for resizing
+            concurrency: Maximum snapshots requested from the NVR at once
+
+        Returns:
+            Mapping of camera ID to JPEG image bytes
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(camera_id: str) -> tuple[str, bytes]:
+            async with semaphore:
+                return camera_id, await self.get_camera_snapshot(camera_id, width, height)
+
+        return dict(await asyncio.gather(*(one(c) for c in dict.fromkeys(camera_ids))))
+
+    def _recent_snapshot(self, key: tuple[Any, ...]) -> Any:
+        """Return a snapshot taken less than SNAPSHOT_TTL seconds ago, if any."""
+        entry = self._snapshots.get(key)
+        if entry is not None and time.monotonic() - entry[0] < SNAPSHOT_TTL:
+            return entry[1]
+        return None
+
+    def _store_snapshot(self, key: tuple[Any, ...], image: Any) -> None:
+        """Remember a snapshot, dropping the oldest once the cache is full."""
+        self._snapshots.pop(key, None)
+        self._snapshots[key] = (time.monotonic(), image)
+        while len(self._snapshots) > _SNAPSHOT_CACHE_SIZE:
+            del self._snapshots[next(iter(self._snapshots))]
 
     # =========================================================================
     # Liveviews
@@ -276,7 +776,7 @@ class UniFiProtectClient:
         Returns:
             List of liveview configurations
         """
-        return await self._get("/liveviews")
+        return await self._cached_get("/liveviews")
 
     # =========================================================================
     # Sensors & Accessories
@@ -288,7 +788,7 @@ class UniFiProtectClient:
         Returns:
             List of light information
         """
-        return await self._get("/lights")
+        return await self._cached_get("/lights")
 
     async def get_sensors(self) -> list[dict[str, Any]]:
         """Get all Protect sensors.
@@ -296,7 +796,7 @@ class UniFiProtectClient:
         Returns:
             List of sensor information
         """
-        return await self._get("/sensors")
+        return await self._cached_get("/sensors")
 
     async def get_chimes(self) -> list[dict[str, Any]]:
         """Get all Protect chimes.
@@ -304,7 +804,7 @@ class UniFiProtectClient:
         Returns:
             List of chime information
         """
-        return await self._get("/chimes")
+        return await self._cached_get("/chimes")
 
     async def get_viewers(self) -> list[dict[str, Any]]:
         """Get all Protect viewers (Viewport devices).
@@ -312,7 +812,7 @@ class UniFiProtectClient:
         Returns:
             List of viewer information
         """
-        return await self._get("/viewers")
+        return await self._cached_get("/viewers")
 
     # =========================================================================
     # Helper Methods
@@ -324,27 +824,32 @@ class UniFiProtectClient:
         Returns:
             Summary with camera counts and details
         """
-        cameras = await self.get_cameras()
-
-        connected = [c for c in cameras if c.get("state") == "CONNECTED"]
-        disconnected = [c for c in cameras if c.get("state") == "DISCONNECTED"]
+        cameras = await self._project_listing("/cameras", _CAMERA_SUMMARY_FIELDS)
+
+        # One pass over the list for both the state counts and the output rows
+        connected = disconnected = 0
+        summaries = []
+        for c in cameras:
+            state = c.get("state")
+            if state == "CONNECTED":
+                connected += 1
+            elif state == "DISCONNECTED":
+                disconnected += 1
+            summaries.append({
+                "id": c.get("id"),
+                "name": c.get("name"),
+                "state": state,
+                "model": c.get("type") or c.get("modelKey"),
+                "mac": c.get("mac"),
+                "is_mic_enabled": c.get("isMicEnabled"),
+                "is_recording": c.get("isRecording"),
+            })
 
         return {
             "total_cameras": len(cameras),
-            "connected": len(connected),
-            "disconnected": len(disconnected),
-            "cameras": [
-                {
-                    "id": c.get("id"),
-                    "name": c.get("name"),
-                    "state": c.get("state"),
-                    "model": c.get("type") or c.get("modelKey"),
-                    "mac": c.get("mac"),
-                    "is_mic_enabled": c.get("isMicEnabled"),
-                    "is_recording": c.get("isRecording"),
-                }
-                for c in cameras
-            ],
+            "connected": connected,
+            "disconnected": disconnected,
+            "cameras": summaries,
         }
 
     async def get_system_info(self) -> dict[str, Any]:
@@ -353,22 +858,25 @@ class UniFiProtectClient:
         Returns:
             System info including camera/sensor counts
         """
-        cameras = await self.get_cameras()
-        lights = await self.get_lights()
-        sensors = await self.get_sensors()
-        chimes = await self.get_chimes()
-        viewers = await self.get_viewers()
-        liveviews = await self.get_liveviews()
+        # Independent endpoints: fetch them concurrently over the shared pool
+        cameras, lights, sensors, chimes, viewers, liveviews = await asyncio.gather(
+            self._project_listing("/cameras", ("state",)),
+            self.get_lights(),
+            self.get_sensors(),
+            self.get_chimes(),
+            self.get_viewers(),
+            self.get_liveviews(),
+        )
 
-        connected_cams = [c for c in cameras if c.get("state") == "CONNECTED"]
+        connected_cams = sum(1 for c in cameras if c.get("state") == "CONNECTED")
 
         return {
             "device_name": self.device.name,
             "device_url": self.device.url,
             "cameras": {
                 "total": len(cameras),
-                "connected": len(connected_cams),
-                "disconnected": len(cameras) - len(connected_cams),
+                "connected": connected_cams,
+                "disconnected": len(cameras) - connected_cams,
             },
             "accessories": {
                 "lights": len(lights),
@@ -409,47 +917,24 @@ class UniFiProtectClient:
         """
         await self._ensure_session_auth()
 
-        url = f"{self.internal_base_url}{endpoint}"
+        url = _protect_url(self.internal_base_url, endpoint)
 
-        try:
-            response = await self.client.request(
-                method,
-                url,
-                headers=self._session_headers,
-                **kwargs,
-            )
-        except httpx.ConnectError as e:
-            raise UniFiConnectionError(f"Failed to connect to Protect: {e}") from e
-        except httpx.TimeoutException as e:
-            raise UniFiConnectionError(f"Request timed out: {e}") from e
+        response = await self._send(method, url, self._session_headers, **kwargs)
 
         if response.status_code == 401:
             # Session may have expired, try to re-auth
             self._session_authenticated = False
             await self._ensure_session_auth()
-            response = await self.client.request(
-                method,
-                url,
-                headers=self._session_headers,
-                **kwargs,
-            )
+            response = await self._send(method, url, self._session_headers, **kwargs)
 
-        if response.status_code == 401:
-            raise UniFiAPIError("Authentication failed", 401)
-        if response.status_code == 404:
-            raise UniFiNotFoundError("Resource", endpoint)
-        if response.status_code >= 400:
-            raise UniFiAPIError(
-                f"API error: {response.text[:200]}",
-                response.status_code,
-            )
+        self._raise_for_status(response, endpoint)
 
         return response
 
     async def _internal_get(self, endpoint: str, **kwargs: Any) -> Any:
         """Make a GET request to internal API and return JSON."""
         response = await self._internal_request("GET", endpoint, **kwargs)
-        return response.json()
+        return orjson.loads(response.content)
 
     # =========================================================================
     # Events (requires session auth)
@@ -481,20 +966,15 @@ class UniFiProtectClient:
             UniFiAuthError: If credentials not configured
         """
         if end is None:
-            end = int(time.time() * 1000)
+            end = _now_ms()
         if start is None:
-            start = end - (24 * 60 * 60 * 1000)  # 24 hours ago
-
-        params = {
-            "start": start,
-            "end": end,
-            "limit": limit,
-        }
+            start = end - 24 * _HOUR_MS  # 24 hours ago
 
+        params = {"start": str(start), "end": str(end), "limit": str(limit)}
         if camera_ids:
-            params["cameras"] = ",".join(camera_ids)
+            params["cameras"] = _join_csv(tuple(camera_ids))
         if types:
-            params["types"] = ",".join(types)
+            params["types"] = _join_csv(tuple(types))
 
         return await self._internal_get("/events", params=params)
 
@@ -516,8 +996,8 @@ class UniFiProtectClient:
         Returns:
             List of motion events
         """
-        end = int(time.time() * 1000)
-        start = end - (hours * 60 * 60 * 1000)
+        end = _now_ms()
+        start = end - hours * _HOUR_MS
 
         camera_ids = [camera_id] if camera_id else None
         events = await self.get_events(
@@ -543,13 +1023,15 @@ class UniFiProtectClient:
             hours: Number of hours to look back (default: 24)
             limit: Maximum number of events
             camera_id: Filter to specific camera
-            detection_types: Filter by detection type (person, vehicle, animal, package)
+            detection_types: Filter by detection type (person, vehicle, animal, package).
+                The events API has no detection-type filter, so this is applied
+                client-side after fetching; ``limit`` counts events before it.
 
         Returns:
             List of smart detection events
         """
-        end = int(time.time() * 1000)
-        start = end - (hours * 60 * 60 * 1000)
+        end = _now_ms()
+        start = end - hours * _HOUR_MS
 
         camera_ids = [camera_id] if camera_id else None
         events = await self.get_events(
@@ -562,10 +1044,8 @@ class UniFiProtectClient:
 
         # Filter by detection type if specified
         if detection_types:
-            events = [
-                e for e in events
-                if any(dt in e.get("smartDetectTypes", []) for dt in detection_types)
-            ]
+            wanted = frozenset(detection_types)
+            events = [e for e in events if not wanted.isdisjoint(e.get("smartDetectTypes") or ())]
 
         return events
 
@@ -593,8 +1073,9 @@ class UniFiProtectClient:
         Returns:
             Base64-encoded JPEG image
         """
-        image_bytes = await self.get_event_thumbnail(event_id)
-        return base64.b64encode(image_bytes).decode("utf-8")
+        return await _b64encode_stream(
+            self._stream_binary(f"/events/{event_id}/thumbnail", internal=True)
+        )
 
     async def get_event_animated_thumbnail(self, event_id: str) -> bytes:
         """Get animated thumbnail (GIF) for an event.
@@ -611,6 +1092,19 @@ class UniFiProtectClient:
         )
         return response.content
 
+    async def get_event_animated_thumbnail_base64(self, event_id: str) -> str:
+        """Get animated thumbnail (GIF) for an event as base64.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Base64-encoded GIF image
+        """
+        return await _b64encode_stream(
+            self._stream_binary(f"/events/{event_id}/animated-thumbnail", internal=True)
+        )
+
     # =========================================================================
     # Event Summary Helpers
     # =========================================================================
@@ -629,8 +1123,8 @@ class UniFiProtectClient:
         Returns:
             Event summary with counts by type
         """
-        end = int(time.time() * 1000)
-        start = end - (hours * 60 * 60 * 1000)
+        end = _now_ms()
+        start = end - hours * _HOUR_MS
 
         camera_ids = [camera_id] if camera_id else None
 
@@ -642,38 +1136,25 @@ class UniFiProtectClient:
             camera_ids=camera_ids,
         )
 
-        # Categorize events
-        motion_count = 0
-        smart_detect_count = 0
-        ring_count = 0
-        other_count = 0
-
-        smart_detect_breakdown = {
-            "person": 0,
-            "vehicle": 0,
-            "animal": 0,
-            "package": 0,
-        }
-
+        # Categorize events in one pass
+        type_counts: Counter[str] = Counter()
+        smart_counts: Counter[str] = Counter()
         cameras_with_events = set()
 
         for event in events:
             event_type = event.get("type", "").lower()
+            type_counts[event_type] += 1
             camera = event.get("camera")
             if camera:
                 cameras_with_events.add(camera)
+            if event_type == "smartdetect":
+                smart_counts.update(
+                    _SMART_DETECT_SET.intersection(event.get("smartDetectTypes") or ())
+                )
 
-            if event_type == "motion":
-                motion_count += 1
-            elif event_type == "smartdetect":
-                smart_detect_count += 1
-                for detect_type in event.get("smartDetectTypes", []):
-                    if detect_type in smart_detect_breakdown:
-                        smart_detect_breakdown[detect_type] += 1
-            elif event_type == "ring":
-                ring_count += 1
-            else:
-                other_count += 1
+        motion_count = type_counts["motion"]
+        smart_detect_count = type_counts["smartdetect"]
+        ring_count = type_counts["ring"]
 
         return {
             "period_hours": hours,
@@ -681,15 +1162,43 @@ class UniFiProtectClient:
             "motion_events": motion_count,
             "smart_detections": smart_detect_count,
             "doorbell_rings": ring_count,
-            "other_events": other_count,
-            "smart_detection_breakdown": smart_detect_breakdown,
+            "other_events": len(events) - motion_count - smart_detect_count - ring_count,
+            "smart_detection_breakdown": {k: smart_counts[k] for k in _SMART_DETECT_TYPES},
             "cameras_with_activity": len(cameras_with_events),
             "filtered_camera": camera_id,
         }
 
+    async def _camera_names_by_id(self, refresh: bool = False) -> dict[str, str]:
+        """Get a camera ID -> name map, reused for ``names_ttl`` seconds.
+
+        Cameras reported without an ID or name are left out, so events from
+        them fall back to showing the camera ID.
+
+        Args:
+            refresh: Rebuild the map from a freshly fetched cameras listing
+
+        Returns:
+            Camera names keyed by camera ID
+        """
+        key = (self.base_url, "camera_names_by_id")
+        entry = self._cache.get(key)
+        if not refresh and entry is not None and time.monotonic() - entry[0] < self._names_ttl:
+            return entry[1]
+
+        if refresh:
+            self._cache.pop((self.base_url, "/cameras"), None)
+        names: dict[str, str] = {}
+        for camera in await self.get_cameras():
+            camera_id, name = camera.get("id"), camera.get("name")
+            if camera_id and name:
+                names[camera_id] = name
+        self._cache[key] = (time.monotonic(), names, None)
+        return names
+
     async def get_recent_activity(
         self,
         limit: int = 20,
+        refresh: bool = False,
     ) -> list[dict[str, Any]]:
         """Get recent activity across all cameras.
 
@@ -697,33 +1206,33 @@ class UniFiProtectClient:
 
         Args:
             limit: Maximum number of events
+            refresh: Re-read camera names instead of using the cached map
 
         Returns:
             List of simplified event info
         """
-        events = await self.get_events(limit=limit)
-
-        # Get camera names for better readability
-        cameras = await self.get_cameras()
-        camera_names = {c.get("id"): c.get("name") for c in cameras}
+        # Camera names make the events readable; fetch both at once
+        events, camera_names = await asyncio.gather(
+            self.get_events(limit=limit),
+            self._camera_names_by_id(refresh),
+        )
 
+        strftime, localtime = time.strftime, time.localtime
         result = []
         for event in events:
             camera_id = event.get("camera")
             event_time = event.get("start", event.get("timestamp", 0))
 
-            # Convert timestamp to readable format
+            # Convert timestamp (ms) to readable local time without a datetime object
             if event_time:
-                from datetime import datetime
-                dt = datetime.fromtimestamp(event_time / 1000)
-                time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+                time_str = strftime(_EVENT_TIME_FORMAT, localtime(event_time / 1000))
             else:
                 time_str = "Unknown"
 
             result.append({
                 "id": event.get("id"),
                 "type": event.get("type"),
-                "camera": camera_names.get(camera_id, camera_id),
+                "camera": camera_names.get(camera_id or "", camera_id),
                 "camera_id": camera_id,
                 "time": time_str,
                 "timestamp": event_time,
@@ -1,14 +1,45 @@
 """Configuration settings for UniFi MCP Server."""
 
-import json
 import logging
-from typing import Literal
-
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property, lru_cache
+from typing import Any, Literal, NamedTuple
+
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    import ijson
+except ImportError:  # optional: pip install unifi-mcp[speedups]
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# UNIFI_DEVICES payloads at least this long are stream-parsed when ijson is available
+_DEVICES_STREAM_THRESHOLD = 4096
+# Parse errors: pydantic's ValidationError subclasses ValueError, ijson's errors do not
+_DEVICES_JSON_ERRORS: tuple[type[Exception], ...] = (
+    (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+)
+
+# URL properties derived from fields once and cached; dropped when a field changes
+_DEVICE_DERIVED = (
+    "network_api_base",
+    "protect_api_base",
+    "protect_internal_api_base",
+    "auth_url",
+    "has_network",
+    "has_protect",
+    "has_protect_credentials",
+)
+_SETTINGS_DERIVED = ("api_base_url", "auth_url", "uses_api_key")
+
 
 class UniFiDevice(BaseModel):
     """Configuration for a single UniFi device."""
@@ -16,8 +47,9 @@ class UniFiDevice(BaseModel):
     name: str = Field(description="Friendly name for the device")
     url: str = Field(description="Base URL of the device (e.g., https://10.1.3.1)")
     api_key: str = Field(description="API key for the device")
-    services: list[Literal["network", "protect"]] = Field(
-        default=["network"],
+    # A set: only membership is ever tested. JSON lists are accepted as input.
+    services: frozenset[Literal["network", "protect"]] = Field(
+        default=frozenset({"network"}),
         description="Services available on this device",
     )
 
@@ -47,37 +79,65 @@ class UniFiDevice(BaseModel):
         description="Password for session auth (required for Protect events)",
     )
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            for attr in _DEVICE_DERIVED:
+                vars(self).pop(attr, None)
+
+    @cached_property
     def network_api_base(self) -> str:
         """Get the Network Integration API base URL."""
-        return f"{self.url.rstrip('/')}/proxy/network/integration"
+        return f"{self.url}/proxy/network/integration"
 
-    @property
+    @cached_property
     def protect_api_base(self) -> str:
         """Get the Protect Integration API base URL."""
-        return f"{self.url.rstrip('/')}/proxy/protect/integration/v1"
+        return f"{self.url}/proxy/protect/integration/v1"
 
-    @property
+    @cached_property
     def protect_internal_api_base(self) -> str:
         """Get the internal Protect API base URL (for events/recordings)."""
-        return f"{self.url.rstrip('/')}/proxy/protect/api"
+        return f"{self.url}/proxy/protect/api"
 
-    @property
+    @cached_property
+    def auth_url(self) -> str:
+        """Get the UniFi OS session login URL."""
+        return f"{self.url}/api/auth/login"
+
+    @cached_property
     def has_network(self) -> bool:
         """Check if device has Network service."""
         return "network" in self.services
 
-    @property
+    @cached_property
     def has_protect(self) -> bool:
         """Check if device has Protect service."""
         return "protect" in self.services
 
-    @property
+    @cached_property
     def has_protect_credentials(self) -> bool:
         """Check if device has credentials for full Protect API access."""
         return bool(self.username and self.password)
 
 
+@lru_cache(maxsize=1)
+def _devices_adapter() -> TypeAdapter[list[UniFiDevice]]:
+    """Validator for a UNIFI_DEVICES array, built on first use."""
+    return TypeAdapter(list[UniFiDevice])
+
+
+class _DeviceViews(NamedTuple):
+    """Configured devices and the lookup views built from them in one pass."""
+
+    devices: list[UniFiDevice]
+    # Lower-cased name -> device
+    by_name: dict[str, UniFiDevice]
+    network: list[UniFiDevice]
+    protect: list[UniFiDevice]
+    names: list[str]
+
+
 class UniFiSettings(BaseSettings):
     """UniFi MCP Server configuration.
 
@@ -124,7 +184,39 @@ class UniFiSettings(BaseSettings):
     # Performance settings
     request_timeout: float = Field(default=30.0)
     max_connections: int = Field(default=10)
+    connect_timeout: float = Field(
+        default=5.0,
+        description="Seconds to wait for a TCP/TLS connection before failing fast",
+    )
+    keepalive_expiry: float = Field(
+        default=300.0,
+        description="Seconds an idle pooled connection is kept open for reuse",
+    )
+    http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 so concurrent requests share one connection per host",
+    )
     cache_ttl: int = Field(default=30)
+    cache_maxsize: int = Field(
+        default=256,
+        description="Maximum number of GET responses kept in the shared response cache",
+    )
+    rate_limit_retries: int = Field(
+        default=2,
+        description="Times to retry a rate-limited (429) request before giving up",
+    )
+    rate_limit_max_wait: float = Field(
+        default=5.0,
+        description="Longest Retry-After delay (seconds) honoured before surfacing the 429",
+    )
+    session_ttl: int = Field(
+        default=3600,
+        description="Expected lifetime (seconds) of a local login session; 0 disables background refresh",
+    )
+    session_prefetch: int = Field(
+        default=300,
+        description="Seconds before session_ttl at which the session is refreshed in the background",
+    )
     poor_signal_threshold: int = Field(
         default=-75,
         description="RSSI threshold below which a wireless client is considered to have poor signal",
@@ -140,7 +232,10 @@ class UniFiSettings(BaseSettings):
         description="Name for the default device when using legacy config",
     )
 
-    _devices: list[UniFiDevice] | None = None
+    # UNIFI_DEVICES given as an already-parsed list (programmatic construction)
+    _devices_data: list[dict[str, Any]] | None = None
+    _device_views: _DeviceViews | None = None
+    _devices_payload: dict[str, Any] | None = None
 
     @field_validator("devices_json", mode="before")
     @classmethod
@@ -154,26 +249,60 @@ class UniFiSettings(BaseSettings):
             if (v.startswith("'") and v.endswith("'")) or (v.startswith('"') and v.endswith('"')):
                 v = v[1:-1]
             return v
-        if isinstance(v, list):
-            return json.dumps(v)
         return v
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def keep_devices_list(cls, data: Any, handler: ValidatorFunctionWrapHandler) -> "UniFiSettings":
+        """Hold a UNIFI_DEVICES list as-is instead of round-tripping it through JSON."""
+        devices = data.get("UNIFI_DEVICES") if isinstance(data, dict) else None
+        if not isinstance(devices, list):
+            return handler(data)
+        settings = handler({**data, "UNIFI_DEVICES": None})
+        settings._devices_data = devices
+        return settings
+
+    @field_validator("controller_url")
+    @classmethod
+    def strip_controller_url(cls, v: str | None) -> str | None:
+        """Drop a trailing slash once so derived URLs can append paths directly."""
+        return v.rstrip("/") if v else v
+
     @property
     def devices(self) -> list[UniFiDevice]:
         """Get list of configured devices."""
-        if self._devices is not None:
-            return self._devices
-
-        devices = []
-
-        # Parse multi-device JSON config
-        if self.devices_json:
+        return self._views().devices
+
+    def _views(self) -> _DeviceViews:
+        """Return the device views, building them on first use."""
+        views = self._device_views
+        if views is None:
+            views = self._device_views = self._load_devices()
+        return views
+
+    def _load_devices(self) -> _DeviceViews:
+        """Build the device list and its lookup views from the configuration."""
+        devices: list[UniFiDevice] = []
+        devices_data = self._devices_data
+        devices_json = self.devices_json or ""
+
+        # Parse multi-device config, given as a list or as JSON
+        if devices_data is not None or devices_json:
             try:
-                devices_data = json.loads(self.devices_json)
-                for d in devices_data:
-                    devices.append(UniFiDevice(**d))
+                if devices_data is not None:
+                    devices = _devices_adapter().validate_python(devices_data)
+                elif ijson is not None and len(devices_json) >= _DEVICES_STREAM_THRESHOLD:
+                    # Build each device as its object is parsed, never the whole array;
+                    # keep none of them unless the whole payload parses
+                    devices = [
+                        UniFiDevice.model_validate(d)
+                        for d in ijson.items(devices_json.encode(), "item", use_float=True)
+                    ]
+                else:
+                    # Parse and validate in one pydantic-core pass
+                    devices = _devices_adapter().validate_json(devices_json)
                 logger.info(f"Loaded {len(devices)} devices from UNIFI_DEVICES config")
-            except (json.JSONDecodeError, ValueError) as e:
+            except _DEVICES_JSON_ERRORS as e:
                 logger.error(f"Failed to parse UNIFI_DEVICES: {e}")
 
         # Fall back to legacy single-device config
@@ -183,15 +312,26 @@ class UniFiSettings(BaseSettings):
                     name=self.default_device_name,
                     url=self.controller_url,
                     api_key=self.cloud_api_key,
-                    services=["network"],  # Legacy config only supported network
+                    services=frozenset({"network"}),  # Legacy config only supported network
                     site=self.site,
                     verify_ssl=self.verify_ssl,
                 )
             )
             logger.info(f"Using legacy single-device config: {self.controller_url}")
 
-        self._devices = devices
-        return devices
+        # Lower-cased name index for get_device; the first device wins on duplicates
+        by_name: dict[str, UniFiDevice] = {}
+        for device in devices:
+            by_name.setdefault(device.name.lower(), device)
+        self._devices_payload = None
+        # Per-service views, shared by every caller (treat them as read-only)
+        return _DeviceViews(
+            devices=devices,
+            by_name=by_name,
+            network=[d for d in devices if d.has_network],
+            protect=[d for d in devices if d.has_protect],
+            names=[d.name for d in devices],
+        )
 
     def get_device(self, name: str | None = None) -> UniFiDevice | None:
         """Get a device by name.
@@ -202,32 +342,62 @@ class UniFiSettings(BaseSettings):
         Returns:
             UniFiDevice or None if not found.
         """
-        if not self.devices:
-            return None
-
+        views = self._views()
         if name is None:
-            return self.devices[0]
-
-        for device in self.devices:
-            if device.name.lower() == name.lower():
-                return device
-
-        return None
+            return views.devices[0] if views.devices else None
+        return views.by_name.get(name.lower())
 
     def get_network_devices(self) -> list[UniFiDevice]:
-        """Get all devices with Network service."""
-        return [d for d in self.devices if d.has_network]
+        """Get all devices with Network service (shared list; do not mutate)."""
+        return self._views().network
 
     def get_protect_devices(self) -> list[UniFiDevice]:
-        """Get all devices with Protect service."""
-        return [d for d in self.devices if d.has_protect]
+        """Get all devices with Protect service (shared list; do not mutate)."""
+        return self._views().protect
 
     def get_device_names(self) -> list[str]:
-        """Get list of all device names."""
-        return [d.name for d in self.devices]
+        """Get list of all device names (shared list; do not mutate)."""
+        return self._views().names
+
+    def devices_payload(self) -> dict[str, Any]:
+        """Summary of the configured devices, as returned by list_unifi_devices.
+
+        Built once per device list and shared between calls; do not mutate.
+        """
+        views = self._views()
+        payload = self._devices_payload
+        if payload is None:
+            payload = self._devices_payload = {
+                "total_devices": len(views.devices),
+                "devices": [
+                    {
+                        "name": d.name,
+                        "url": d.url,
+                        "services": sorted(d.services),
+                        "site": d.site,
+                    }
+                    for d in views.devices
+                ],
+                "network_devices": [d.name for d in views.network],
+                "protect_devices": [d.name for d in views.protect],
+            }
+        return payload
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            for attr in _SETTINGS_DERIVED:
+                vars(self).pop(attr, None)
+            if name == "devices_json":
+                # New JSON replaces a list given at construction
+                self._devices_data = None
+            # UNIFI_DEVICES or the legacy fields may have changed: rebuild the
+            # device list and every view derived from it on next access
+            self._device_views = None
+            self._devices_payload = None
 
     # Legacy compatibility properties
-    @property
+    @cached_property
     def api_base_url(self) -> str:
         """Get the base URL for API requests (legacy compatibility)."""
         device = self.get_device()
@@ -240,28 +410,45 @@ class UniFiSettings(BaseSettings):
         if not self.controller_url:
             raise ValueError("No device configured")
 
-        base = self.controller_url.rstrip("/")
+        base = self.controller_url
         if self.mode == "local_api_key":
             return f"{base}/proxy/network/integration"
         if self.is_udm:
             return f"{base}/proxy/network"
         return base
 
-    @property
+    @cached_property
     def auth_url(self) -> str:
         """Get the authentication URL for session-based auth."""
         if not self.controller_url:
             raise ValueError("No controller URL configured")
-        base = self.controller_url.rstrip("/")
+        base = self.controller_url
         if self.is_udm:
             return f"{base}/api/auth/login"
         return f"{base}/api/login"
 
-    @property
+    @cached_property
     def uses_api_key(self) -> bool:
         """Check if using API key authentication."""
         return self.mode in ("cloud", "local_api_key")
 
 
-# Global settings instance
-settings = UniFiSettings()
+@lru_cache(maxsize=1)
+def get_settings() -> UniFiSettings:
+    """Return the process-wide settings, loading them on first use.
+
+    Reading ``.env`` and the environment is deferred until a caller actually
+    needs configuration. Tests can call ``get_settings.cache_clear()`` to
+    force a reload.
+
+    Returns:
+        The shared UniFiSettings instance.
+    """
+    return UniFiSettings()
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards compatibility for ``from unifi_mcp.config import settings``
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
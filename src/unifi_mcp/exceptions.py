@@ -2,9 +2,12 @@
 
 
 class UniFiError(Exception):
-    """Base exception for all UniFi errors."""
+    """Base exception for all UniFi errors.
 
-    pass
+    Subclasses declare ``__slots__`` so their fields don't need a per-instance dict.
+    """
+
+    __slots__ = ()
 
 
 class UniFiAuthError(UniFiError):
@@ -16,7 +19,7 @@ class UniFiAuthError(UniFiError):
     - API key is invalid (cloud mode)
     """
 
-    pass
+    __slots__ = ()
 
 
 class UniFiConnectionError(UniFiError):
@@ -29,7 +32,7 @@ class UniFiConnectionError(UniFiError):
     - Connection timeout
     """
 
-    pass
+    __slots__ = ()
 
 
 class UniFiAPIError(UniFiError):
@@ -38,6 +41,8 @@ class UniFiAPIError(UniFiError):
     Raised when the API returns an error status code or error message.
     """
 
+    __slots__ = ("status_code", "response_data")
+
     def __init__(self, message: str, status_code: int | None = None, response_data: dict | None = None):
         super().__init__(message)
         self.status_code = status_code
@@ -55,6 +60,8 @@ class UniFiRateLimitError(UniFiAPIError):
     Raised when the API returns a 429 status code.
     """
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str, retry_after: int | None = None):
         super().__init__(message, status_code=429)
         self.retry_after = retry_after
@@ -66,6 +73,8 @@ class UniFiNotFoundError(UniFiAPIError):
     Raised when requesting a device, client, or other resource that doesn't exist.
     """
 
+    __slots__ = ("resource_type", "identifier")
+
     def __init__(self, resource_type: str, identifier: str):
         message = f"{resource_type} not found: {identifier}"
         super().__init__(message, status_code=404)
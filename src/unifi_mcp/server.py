@@ -1,20 +1,40 @@
 """UniFi MCP Server - Main entry point."""
 
+import asyncio
+import importlib
 import logging
 import sys
+from collections.abc import Callable
+from functools import lru_cache
+from types import ModuleType
 
 from mcp.server.fastmcp import Context, FastMCP
 
 from unifi_mcp.clients.base import create_app_lifespan
-from unifi_mcp.config import settings
+from unifi_mcp.config import get_settings
 from unifi_mcp.utils import setup_logging
-from unifi_mcp.utils.privacy import mask_pii_data
-from unifi_mcp.tools.network import clients as client_tools
-from unifi_mcp.tools.network import devices as device_tools
-from unifi_mcp.tools.network import insights as insight_tools
-from unifi_mcp.tools.network import sites as site_tools
-from unifi_mcp.tools.network import stats as stat_tools
-from unifi_mcp.tools.protect import cameras as protect_tools
+
+
+def _lazy(module: str) -> Callable[[], ModuleType]:
+    """Return a loader that imports ``module`` on its first call.
+
+    Tool modules are only imported once one of their tools is used, so
+    starting the server does not pay for every tool family up front.
+    """
+
+    @lru_cache(maxsize=1)
+    def load() -> ModuleType:
+        return importlib.import_module(module)
+
+    return load
+
+
+_client_tools = _lazy("unifi_mcp.tools.network.clients")
+_device_tools = _lazy("unifi_mcp.tools.network.devices")
+_insight_tools = _lazy("unifi_mcp.tools.network.insights")
+_site_tools = _lazy("unifi_mcp.tools.network.sites")
+_stat_tools = _lazy("unifi_mcp.tools.network.stats")
+_protect_tools = _lazy("unifi_mcp.tools.protect.cameras")
 
 # Configure logging
 logging.basicConfig(
@@ -56,43 +76,43 @@ mcp = FastMCP(
 @mcp.tool()
 async def list_devices(ctx: Context, site: str = "default"):
     """List all UniFi network devices (APs, switches, routers)."""
-    return await device_tools.list_devices(ctx, site)
+    return await _device_tools().list_devices(ctx, site)
 
 
 @mcp.tool()
 async def get_device_details(ctx: Context, mac: str, site: str = "default"):
     """Get detailed information about a specific device."""
-    return await device_tools.get_device_details(ctx, mac, site)
+    return await _device_tools().get_device_details(ctx, mac, site)
 
 
 @mcp.tool()
 async def restart_device(ctx: Context, mac: str, site: str = "default"):
     """Restart a UniFi device."""
-    return await device_tools.restart_device(ctx, mac, site)
+    return await _device_tools().restart_device(ctx, mac, site)
 
 
 @mcp.tool()
 async def locate_device(ctx: Context, mac: str, enabled: bool = True, site: str = "default"):
     """Enable/disable LED blinking to locate a device."""
-    return await device_tools.locate_device(ctx, mac, enabled, site)
+    return await _device_tools().locate_device(ctx, mac, enabled, site)
 
 
 @mcp.tool()
 async def get_device_stats(ctx: Context, mac: str, site: str = "default"):
     """Get performance statistics for a device."""
-    return await device_tools.get_device_stats(ctx, mac, site)
+    return await _device_tools().get_device_stats(ctx, mac, site)
 
 
 @mcp.tool()
 async def upgrade_device(ctx: Context, mac: str, site: str = "default"):
     """Upgrade device firmware to the latest version."""
-    return await device_tools.upgrade_device(ctx, mac, site)
+    return await _device_tools().upgrade_device(ctx, mac, site)
 
 
 @mcp.tool()
 async def provision_device(ctx: Context, mac: str, site: str = "default"):
     """Force re-provision a device with current configuration."""
-    return await device_tools.provision_device(ctx, mac, site)
+    return await _device_tools().provision_device(ctx, mac, site)
 
 
 # =============================================================================
@@ -103,49 +123,67 @@ async def provision_device(ctx: Context, mac: str, site: str = "default"):
 @mcp.tool()
 async def list_clients(ctx: Context, site: str = "default"):
     """List all currently connected clients."""
-    return await client_tools.list_clients(ctx, site)
+    return await _client_tools().list_clients(ctx, site)
 
 
 @mcp.tool()
 async def list_all_clients(ctx: Context, site: str = "default"):
     """List all known clients (including offline)."""
-    return await client_tools.list_all_clients(ctx, site)
+    return await _client_tools().list_all_clients(ctx, site)
 
 
 @mcp.tool()
 async def get_client_details(ctx: Context, mac: str, site: str = "default"):
     """Get detailed information about a specific client."""
-    return await client_tools.get_client_details(ctx, mac, site)
+    return await _client_tools().get_client_details(ctx, mac, site)
 
 
 @mcp.tool()
 async def block_client(ctx: Context, mac: str, site: str = "default"):
     """Block a client from the network."""
-    return await client_tools.block_client(ctx, mac, site)
+    return await _client_tools().block_client(ctx, mac, site)
 
 
 @mcp.tool()
 async def unblock_client(ctx: Context, mac: str, site: str = "default"):
     """Unblock a previously blocked client."""
-    return await client_tools.unblock_client(ctx, mac, site)
+    return await _client_tools().unblock_client(ctx, mac, site)
 
 
 @mcp.tool()
 async def kick_client(ctx: Context, mac: str, site: str = "default"):
     """Disconnect a client (they can reconnect)."""
-    return await client_tools.kick_client(ctx, mac, site)
+    return await _client_tools().kick_client(ctx, mac, site)
 
 
 @mcp.tool()
 async def forget_client(ctx: Context, mac: str, site: str = "default"):
     """Remove a client from the known clients list."""
-    return await client_tools.forget_client(ctx, mac, site)
+    return await _client_tools().forget_client(ctx, mac, site)
+
+
+@mcp.tool()
+async def block_clients(ctx: Context, macs: list[str], site: str = "default"):
+    """Block several clients from the network at once."""
+    return await _client_tools().block_clients(ctx, macs, site)
+
+
+@mcp.tool()
+async def unblock_clients(ctx: Context, macs: list[str], site: str = "default"):
+    """Unblock several previously blocked clients at once."""
+    return await _client_tools().unblock_clients(ctx, macs, site)
+
+
+@mcp.tool()
+async def kick_clients(ctx: Context, macs: list[str], site: str = "default"):
+    """Disconnect several clients at once (they can reconnect)."""
+    return await _client_tools().kick_clients(ctx, macs, site)
 
 
 @mcp.tool()
 async def get_client_traffic(ctx: Context, mac: str, site: str = "default"):
     """Get traffic statistics for a specific client."""
-    return await client_tools.get_client_traffic(ctx, mac, site)
+    return await _client_tools().get_client_traffic(ctx, mac, site)
 
 
 # =============================================================================
@@ -156,55 +194,55 @@ async def get_client_traffic(ctx: Context, mac: str, site: str = "default"):
 @mcp.tool()
 async def list_sites(ctx: Context):
     """List all UniFi sites accessible to the current user."""
-    return await site_tools.list_sites(ctx)
+    return await _site_tools().list_sites(ctx)
 
 
 @mcp.tool()
 async def get_site_health(ctx: Context, site: str = "default"):
     """Get comprehensive health status for a site."""
-    return await site_tools.get_site_health(ctx, site)
+    return await _site_tools().get_site_health(ctx, site)
 
 
 @mcp.tool()
 async def get_site_settings(ctx: Context, site: str = "default"):
     """Get site configuration settings."""
-    return await site_tools.get_site_settings(ctx, site)
+    return await _site_tools().get_site_settings(ctx, site)
 
 
 @mcp.tool()
 async def get_sysinfo(ctx: Context, site: str = "default"):
     """Get system information for the site controller."""
-    return await site_tools.get_sysinfo(ctx, site)
+    return await _site_tools().get_sysinfo(ctx, site)
 
 
 @mcp.tool()
 async def get_networks(ctx: Context, site: str = "default"):
     """Get all network/VLAN configurations."""
-    return await site_tools.get_networks(ctx, site)
+    return await _site_tools().get_networks(ctx, site)
 
 
 @mcp.tool()
 async def get_wlans(ctx: Context, site: str = "default"):
     """Get all wireless network (SSID) configurations."""
-    return await site_tools.get_wlans(ctx, site)
+    return await _site_tools().get_wlans(ctx, site)
 
 
 @mcp.tool()
 async def get_port_profiles(ctx: Context, site: str = "default"):
     """Get switch port profile configurations."""
-    return await site_tools.get_port_profiles(ctx, site)
+    return await _site_tools().get_port_profiles(ctx, site)
 
 
 @mcp.tool()
 async def get_firewall_rules(ctx: Context, site: str = "default"):
     """Get firewall rule configurations."""
-    return await site_tools.get_firewall_rules(ctx, site)
+    return await _site_tools().get_firewall_rules(ctx, site)
 
 
 @mcp.tool()
 async def get_routing_table(ctx: Context, site: str = "default"):
     """Get the current routing table."""
-    return await site_tools.get_routing_table(ctx, site)
+    return await _site_tools().get_routing_table(ctx, site)
 
 
 # =============================================================================
@@ -215,49 +253,49 @@ async def get_routing_table(ctx: Context, site: str = "default"):
 @mcp.tool()
 async def get_network_health(ctx: Context, site: str = "default"):
     """Get overall network health summary."""
-    return await stat_tools.get_network_health(ctx, site)
+    return await _stat_tools().get_network_health(ctx, site)
 
 
 @mcp.tool()
 async def get_recent_events(ctx: Context, limit: int = 50, site: str = "default"):
     """Get recent network events."""
-    return await stat_tools.get_recent_events(ctx, limit, site)
+    return await _stat_tools().get_recent_events(ctx, limit, site)
 
 
 @mcp.tool()
 async def get_alarms(ctx: Context, site: str = "default"):
     """Get active alarms."""
-    return await stat_tools.get_alarms(ctx, site)
+    return await _stat_tools().get_alarms(ctx, site)
 
 
 @mcp.tool()
 async def archive_all_alarms(ctx: Context, site: str = "default"):
     """Archive all active alarms."""
-    return await stat_tools.archive_all_alarms(ctx, site)
+    return await _stat_tools().archive_all_alarms(ctx, site)
 
 
 @mcp.tool()
 async def run_speed_test(ctx: Context, site: str = "default"):
     """Initiate a WAN speed test."""
-    return await stat_tools.run_speed_test(ctx, site)
+    return await _stat_tools().run_speed_test(ctx, site)
 
 
 @mcp.tool()
 async def get_speed_test_status(ctx: Context, site: str = "default"):
     """Get speed test status and results."""
-    return await stat_tools.get_speed_test_status(ctx, site)
+    return await _stat_tools().get_speed_test_status(ctx, site)
 
 
 @mcp.tool()
 async def get_dpi_stats(ctx: Context, site: str = "default"):
     """Get Deep Packet Inspection statistics for the site."""
-    return await stat_tools.get_dpi_stats(ctx, site)
+    return await _stat_tools().get_dpi_stats(ctx, site)
 
 
 @mcp.tool()
 async def get_traffic_summary(ctx: Context, site: str = "default"):
     """Get traffic summary for the site."""
-    return await stat_tools.get_traffic_summary(ctx, site)
+    return await _stat_tools().get_traffic_summary(ctx, site)
 
 
 # =============================================================================
@@ -273,7 +311,7 @@ async def analyze_network_issues(ctx: Context, site: str = "default"):
     Aggregates device health, client connection issues, interference,
     firmware status, and recent alarms into an AI-friendly summary.
     """
-    return await insight_tools.analyze_network_issues(ctx, site)
+    return await _insight_tools().analyze_network_issues(ctx, site)
 
 
 @mcp.tool()
@@ -284,7 +322,7 @@ async def get_optimization_recommendations(ctx: Context, site: str = "default"):
     Checks channel selection, TX power, VLAN efficiency, port configurations,
     and bandwidth utilization patterns.
     """
-    return await insight_tools.get_optimization_recommendations(ctx, site)
+    return await _insight_tools().get_optimization_recommendations(ctx, site)
 
 
 @mcp.tool()
@@ -295,7 +333,7 @@ async def get_client_experience_report(ctx: Context, site: str = "default"):
     Includes signal strength distribution, roaming stats, failed connections,
     and problematic clients.
     """
-    return await insight_tools.get_client_experience_report(ctx, site)
+    return await _insight_tools().get_client_experience_report(ctx, site)
 
 
 @mcp.tool()
@@ -306,7 +344,7 @@ async def get_device_health_summary(ctx: Context, site: str = "default"):
     Includes uptime, load, memory, temperature, firmware versions,
     and devices needing attention.
     """
-    return await insight_tools.get_device_health_summary(ctx, site)
+    return await _insight_tools().get_device_health_summary(ctx, site)
 
 
 @mcp.tool()
@@ -317,7 +355,7 @@ async def get_traffic_analysis(ctx: Context, hours: int = 24, site: str = "defau
     Includes top talkers, application breakdown (DPI), bandwidth trends,
     and unusual activity.
     """
-    return await insight_tools.get_traffic_analysis(ctx, hours, site)
+    return await _insight_tools().get_traffic_analysis(ctx, hours, site)
 
 
 @mcp.tool()
@@ -328,7 +366,7 @@ async def troubleshoot_client(ctx: Context, mac: str, site: str = "default"):
     Includes connection history, signal quality, AP associations,
     roaming events, and potential issues.
     """
-    return await insight_tools.troubleshoot_client(ctx, mac, site)
+    return await _insight_tools().troubleshoot_client(ctx, mac, site)
 
 
 # =============================================================================
@@ -339,13 +377,13 @@ async def troubleshoot_client(ctx: Context, mac: str, site: str = "default"):
 @mcp.tool()
 async def list_cameras(ctx: Context, device: str | None = None):
     """List all UniFi Protect cameras with status."""
-    return await protect_tools.list_cameras(ctx, device)
+    return await _protect_tools().list_cameras(ctx, device)
 
 
 @mcp.tool()
 async def get_camera_details(ctx: Context, camera_id: str, device: str | None = None):
     """Get detailed information about a specific camera."""
-    return await protect_tools.get_camera_details(ctx, camera_id, device)
+    return await _protect_tools().get_camera_details(ctx, camera_id, device)
 
 
 @mcp.tool()
@@ -361,13 +399,13 @@ async def get_camera_snapshot(
 
     Returns a base64-encoded JPEG image.
     """
-    return await protect_tools.get_camera_snapshot(ctx, camera_id, device, width, height)
+    return await _protect_tools().get_camera_snapshot(ctx, camera_id, device, width, height)
 
 
 @mcp.tool()
 async def get_protect_system_info(ctx: Context, device: str | None = None):
     """Get UniFi Protect system information including camera and accessory counts."""
-    return await protect_tools.get_protect_system_info(ctx, device)
+    return await _protect_tools().get_protect_system_info(ctx, device)
 
 
 @mcp.tool()
@@ -377,19 +415,19 @@ async def get_camera_health_summary(ctx: Context, device: str | None = None):
 
     Provides an overview of camera status, connectivity, and potential issues.
     """
-    return await protect_tools.get_camera_health_summary(ctx, device)
+    return await _protect_tools().get_camera_health_summary(ctx, device)
 
 
 @mcp.tool()
 async def get_liveviews(ctx: Context, device: str | None = None):
     """Get all configured Protect liveviews."""
-    return await protect_tools.get_liveviews(ctx, device)
+    return await _protect_tools().get_liveviews(ctx, device)
 
 
 @mcp.tool()
 async def get_protect_accessories(ctx: Context, device: str | None = None):
     """Get all Protect accessories (lights, sensors, chimes, viewers)."""
-    return await protect_tools.get_protect_accessories(ctx, device)
+    return await _protect_tools().get_protect_accessories(ctx, device)
 
 
 # =============================================================================
@@ -410,7 +448,7 @@ async def get_motion_events(
 
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_motion_events(ctx, hours, limit, camera_id, device)
+    return await _protect_tools().get_motion_events(ctx, hours, limit, camera_id, device)
 
 
 @mcp.tool()
@@ -426,7 +464,7 @@ async def get_smart_detections(
 
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_smart_detections(ctx, hours, limit, detection_type, device)
+    return await _protect_tools().get_smart_detections(ctx, hours, limit, detection_type, device)
 
 
 @mcp.tool()
@@ -437,7 +475,7 @@ async def get_protect_event_summary(ctx: Context, hours: int = 24, device: str |
     Shows motion count, smart detections breakdown, and doorbell activity.
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_event_summary(ctx, hours, device)
+    return await _protect_tools().get_event_summary(ctx, hours, device)
 
 
 @mcp.tool()
@@ -448,7 +486,7 @@ async def get_recent_protect_activity(ctx: Context, limit: int = 20, device: str
     Provides a quick overview of the most recent events.
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_recent_activity(ctx, limit, device)
+    return await _protect_tools().get_recent_activity(ctx, limit, device)
 
 
 @mcp.tool()
@@ -460,7 +498,7 @@ async def get_event_thumbnail(ctx: Context, event_id: str, device: str | None =
     Use event IDs from get_motion_events, get_smart_detections, or get_recent_protect_activity.
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_event_thumbnail(ctx, event_id, device)
+    return await _protect_tools().get_event_thumbnail(ctx, event_id, device)
 
 
 @mcp.tool()
@@ -472,7 +510,7 @@ async def get_event_animated_thumbnail(ctx: Context, event_id: str, device: str
     Use event IDs from get_motion_events, get_smart_detections, or get_recent_protect_activity.
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_event_animated_thumbnail(ctx, event_id, device)
+    return await _protect_tools().get_event_animated_thumbnail(ctx, event_id, device)
 
 
 # =============================================================================
@@ -495,7 +533,7 @@ async def get_camera_snapshot_file(
     get_camera_snapshot when the agent runs on the same machine as the MCP
     server, so it can read the file directly for image rendering.
     """
-    return await protect_tools.get_camera_snapshot_file(ctx, camera_id, device, width, height)
+    return await _protect_tools().get_camera_snapshot_file(ctx, camera_id, device, width, height)
 
 
 @mcp.tool()
@@ -508,7 +546,7 @@ async def get_event_thumbnail_file(ctx: Context, event_id: str, device: str | No
     server, so it can read the file directly for image rendering.
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_event_thumbnail_file(ctx, event_id, device)
+    return await _protect_tools().get_event_thumbnail_file(ctx, event_id, device)
 
 
 @mcp.tool()
@@ -521,7 +559,7 @@ async def get_event_animated_thumbnail_file(ctx: Context, event_id: str, device:
     the MCP server, so it can read the file directly for image rendering.
     Requires username and password configured for the Protect device.
     """
-    return await protect_tools.get_event_animated_thumbnail_file(ctx, event_id, device)
+    return await _protect_tools().get_event_animated_thumbnail_file(ctx, event_id, device)
 
 
 # =============================================================================
@@ -537,26 +575,24 @@ async def list_unifi_devices(ctx: Context):
     Shows device names, URLs, and available services (network, protect).
     Use the device name with other tools to target specific devices.
     """
-    devices = settings.devices
-    return {
-        "total_devices": len(devices),
-        "devices": [
-            {
-                "name": d.name,
-                "url": d.url,
-                "services": d.services,
-                "site": d.site,
-            }
-            for d in devices
-        ],
-        "network_devices": [d.name for d in settings.get_network_devices()],
-        "protect_devices": [d.name for d in settings.get_protect_devices()],
-    }
+    return get_settings().devices_payload()
+
+
+def _use_uvloop() -> None:
+    """Run the server on uvloop when it is installed (speedups extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
 
 
 def main():
     """Run the MCP server."""
+    _use_uvloop()
     logger.info("Starting UniFi MCP Server")
+    settings = get_settings()
     device_count = len(settings.devices)
     if device_count > 0:
         logger.info(f"Configured devices: {settings.get_device_names()}")
@@ -262,6 +262,69 @@ async def forget_client(
     }
 
 
+def _bulk_result(results: dict[str, bool], action: str) -> dict[str, Any]:
+    """Summarize a multi-client command result."""
+    failed = [mac for mac, ok in results.items() if not ok]
+    return {
+        "success": not failed,
+        "message": f"{len(results) - len(failed)} of {len(results)} clients {action}",
+        "action": action,
+        "results": results,
+        "failed": failed,
+    }
+
+
+async def block_clients(
+    ctx: Context, macs: list[str], site: str = "default"
+) -> dict[str, Any]:
+    """Block several clients from the network at once.
+
+    Args:
+        ctx: MCP context
+        macs: Client MAC addresses
+        site: Site name
+
+    Returns:
+        Per-client command results.
+    """
+    client = _get_client(ctx)
+    return _bulk_result(await client.block_clients(macs, site), "blocked")
+
+
+async def unblock_clients(
+    ctx: Context, macs: list[str], site: str = "default"
+) -> dict[str, Any]:
+    """Unblock several previously blocked clients at once.
+
+    Args:
+        ctx: MCP context
+        macs: Client MAC addresses
+        site: Site name
+
+    Returns:
+        Per-client command results.
+    """
+    client = _get_client(ctx)
+    return _bulk_result(await client.unblock_clients(macs, site), "unblocked")
+
+
+async def kick_clients(
+    ctx: Context, macs: list[str], site: str = "default"
+) -> dict[str, Any]:
+    """Disconnect several clients from the network at once.
+
+    Args:
+        ctx: MCP context
+        macs: Client MAC addresses
+        site: Site name
+
+    Returns:
+        Per-client command results.
+    """
+    client = _get_client(ctx)
+    return _bulk_result(await client.kick_clients(macs, site), "kicked")
+
+
 async def get_client_traffic(
     ctx: Context, mac: str, site: str = "default"
 ) -> dict[str, Any]:
@@ -1,12 +1,13 @@
 """AI-friendly network analysis and insight tools for UniFi Network."""
 
+import asyncio
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
 from unifi_mcp.clients.base import AppContext
 from unifi_mcp.clients.network import UniFiNetworkClient
-from unifi_mcp.config import settings
+from unifi_mcp.config import get_settings
 
 
 def _get_client(ctx: Context) -> UniFiNetworkClient:
@@ -32,12 +33,14 @@ async def analyze_network_issues(ctx: Context, site: str = "default") -> dict[st
     client = _get_client(ctx)
 
     # Gather data
-    devices = await client.get_devices(site)
-    clients = await client.get_clients(site)
-    health = await client.get_site_health(site)
-    alarms = await client.get_alarms(site)
     # We don't use events directly yet but keep it for future use as upstream added it
-    _ = await client.get_events(100, site)
+    devices, clients, health, alarms, _ = await asyncio.gather(
+        client.get_devices(site),
+        client.get_clients(site),
+        client.get_site_health(site),
+        client.get_alarms(site),
+        client.get_events(100, site),
+    )
 
     issues = []
     warnings = []
@@ -102,11 +105,12 @@ async def analyze_network_issues(ctx: Context, site: str = "default") -> dict[st
 
     # Check for poor client signals
     poor_signal_clients = []
+    poor_signal_threshold = get_settings().poor_signal_threshold
     for c in clients:
         if not c.get("is_wired"):
             rssi = c.get("rssi")
             signal = c.get("signal")
-            if rssi and rssi < settings.poor_signal_threshold:
+            if rssi and rssi < poor_signal_threshold:
                 poor_signal_clients.append({
                     "name": c.get("name") or c.get("hostname") or c.get("mac"),
                     "rssi": rssi,
@@ -215,9 +219,11 @@ async def get_optimization_recommendations(
     """
     client = _get_client(ctx)
 
-    devices = await client.get_devices(site)
-    wlans = await client.get_wlans(site)
-    networks = await client.get_networks(site)
+    devices, wlans, networks = await asyncio.gather(
+        client.get_devices(site),
+        client.get_wlans(site),
+        client.get_networks(site),
+    )
 
     recommendations = []
 
@@ -336,8 +342,10 @@ async def get_client_experience_report(
     """
     client = _get_client(ctx)
 
-    clients = await client.get_clients(site)
-    events = await client.get_events(500, site)
+    clients, events = await asyncio.gather(
+        client.get_clients(site),
+        client.get_events(500, site),
+    )
 
     # Analyze wireless clients
     # Integration API uses "type": "WIRELESS" vs traditional "is_wired": false
@@ -416,7 +424,7 @@ async def get_client_experience_report(
         if c.get("tx_retries", 0) > 100:
             issues.append(f"High TX retries: {c.get('tx_retries')}")
 
-        if c.get("rssi") and c.get("rssi") < settings.poor_signal_threshold:
+        if c.get("rssi") and c.get("rssi") < get_settings().poor_signal_threshold:
             issues.append(f"Weak signal: {c.get('rssi')} dBm")
 
         if issues:
@@ -592,8 +600,10 @@ async def get_traffic_analysis(
     """
     client = _get_client(ctx)
 
-    clients = await client.get_clients(site)
-    dpi_stats = await client.get_dpi_stats(site)
+    clients, dpi_stats = await asyncio.gather(
+        client.get_clients(site),
+        client.get_dpi_stats(site),
+    )
 
     # Top clients by traffic
     client_traffic = []
@@ -672,8 +682,10 @@ async def troubleshoot_client(
     client = _get_client(ctx)
 
     # Get client details
-    client_data = await client.get_client(mac, site)
-    events = await client.get_events(200, site)
+    client_data, events = await asyncio.gather(
+        client.get_client(mac, site),
+        client.get_events(200, site),
+    )
 
     is_wired = client_data.get("is_wired", False)
 
@@ -717,7 +729,7 @@ async def troubleshoot_client(
         }
 
         # Check for issues
-        if rssi and rssi < settings.poor_signal_threshold:
+        if rssi and rssi < get_settings().poor_signal_threshold:
             report["issues_detected"].append({
                 "issue": "Weak signal strength",
                 "details": f"RSSI: {rssi} dBm (should be > -70 dBm)",
@@ -1,5 +1,6 @@
 """Statistics and monitoring tools for UniFi Network."""
 
+import asyncio
 from typing import Any
 
 from mcp.server.fastmcp import Context
@@ -29,14 +30,12 @@ async def get_network_health(ctx: Context, site: str = "default") -> dict[str, A
     """
     client = _get_client(ctx)
 
-    # Get health data
-    health_data = await client.get_site_health(site)
-
-    # Get device counts
-    devices = await client.get_devices_basic(site)
-
-    # Get client count
-    clients = await client.get_clients(site)
+    # Health, device and client data are independent, so fetch them together
+    health_data, devices, clients = await asyncio.gather(
+        client.get_site_health(site),
+        client.get_devices_basic(site),
+        client.get_clients(site),
+    )
 
     # Summarize device status
     device_counts = {
@@ -11,7 +11,7 @@ SNAPSHOT_DIR = Path(os.environ.get("UNIFI_SNAPSHOT_DIR", "/tmp/unifi-protect"))
 
 from unifi_mcp.clients.base import AppContext
 from unifi_mcp.clients.protect import UniFiProtectClient
-from unifi_mcp.config import settings
+from unifi_mcp.config import get_settings
 from unifi_mcp.exceptions import UniFiNotFoundError
 
 
@@ -32,16 +32,23 @@ def _get_protect_client(ctx: Context, device_name: str | None = None) -> UniFiPr
 
     # Find device with Protect service
     if device_name:
-        device = settings.get_device(device_name)
+        device = get_settings().get_device(device_name)
         if not device or not device.has_protect:
             raise ValueError(f"Device '{device_name}' not found or doesn't have Protect")
     else:
-        protect_devices = settings.get_protect_devices()
+        protect_devices = get_settings().get_protect_devices()
         if not protect_devices:
             raise ValueError("No Protect-enabled devices configured")
         device = protect_devices[0]
 
-    return UniFiProtectClient(app_ctx.client, device)
+    return UniFiProtectClient(
+        app_ctx.client,
+        device,
+        cache=app_ctx.protect_cache,
+        inflight=app_ctx.inflight,
+        snapshots=app_ctx.protect_snapshots,
+        names_ttl=app_ctx.settings.cache_ttl,
+    )
 
 
 async def list_cameras(
@@ -78,11 +85,7 @@ async def get_camera_details(
     """
     client = _get_protect_client(ctx, device)
 
-    # Try by ID first, then by name
-    try:
-        return await client.get_camera(camera_id)
-    except UniFiNotFoundError:
-        return await client.get_camera_by_name(camera_id)
+    return await client.find_camera(camera_id)
 
 
 async def get_camera_snapshot(
@@ -107,10 +110,7 @@ async def get_camera_snapshot(
     client = _get_protect_client(ctx, device)
 
     # Find camera (by ID or name)
-    try:
-        camera = await client.get_camera(camera_id)
-    except UniFiNotFoundError:
-        camera = await client.get_camera_by_name(camera_id)
+    camera = await client.find_camera(camera_id)
 
     actual_id = camera.get("id")
     if not actual_id:
@@ -164,7 +164,7 @@ async def list_protect_devices(ctx: Context) -> dict[str, Any]:
     Returns:
         List of Protect-enabled devices
     """
-    protect_devices = settings.get_protect_devices()
+    protect_devices = get_settings().get_protect_devices()
 
     return {
         "total_devices": len(protect_devices),
@@ -172,7 +172,7 @@ async def list_protect_devices(ctx: Context) -> dict[str, Any]:
             {
                 "name": d.name,
                 "url": d.url,
-                "services": d.services,
+                "services": sorted(d.services),
             }
             for d in protect_devices
         ],
@@ -524,11 +524,8 @@ async def get_event_animated_thumbnail(
     Returns:
         Dictionary with base64-encoded GIF and metadata
     """
-    import base64
-
     client = _get_protect_client(ctx, device)
-    gif_bytes = await client.get_event_animated_thumbnail(event_id)
-    gif_base64 = base64.b64encode(gif_bytes).decode("utf-8")
+    gif_base64 = await client.get_event_animated_thumbnail_base64(event_id)
 
     return {
         "success": True,
@@ -600,10 +597,7 @@ async def get_camera_snapshot_file(
     client = _get_protect_client(ctx, device)
 
     # Find camera (by ID or name)
-    try:
-        camera = await client.get_camera(camera_id)
-    except UniFiNotFoundError:
-        camera = await client.get_camera_by_name(camera_id)
+    camera = await client.find_camera(camera_id)
 
     actual_id = camera.get("id")
     if not actual_id:
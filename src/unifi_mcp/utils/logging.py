@@ -2,7 +2,7 @@ import logging
 import re
 from typing import Any
 
-from unifi_mcp.config import settings
+from unifi_mcp.config import get_settings
 
 # Regex patterns for common sensitive data
 MAC_REGEX = re.compile(r"([0-9a-fA-F]{2}[:-]){5}([0-9a-fA-F]{2})")
@@ -26,7 +26,7 @@ class SecretMaskingFilter(logging.Filter):
             
         record.msg = self.mask_secrets(record.msg)
         
-        if settings.mask_pii:
+        if get_settings().mask_pii:
             record.msg = self.mask_pii(record.msg)
             
         return True
@@ -1,13 +1,16 @@
 import re
 from typing import Any, TypeVar
 
-from unifi_mcp.config import settings
+from unifi_mcp.config import get_settings
 
 T = TypeVar("T")
 
 MAC_REGEX = re.compile(r"([0-9a-fA-F]{2}[:-]){5}([0-9a-fA-F]{2})")
 IP_REGEX = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b")
 
+# Keys whose values are masked entirely (compared lower-cased)
+SENSITIVE_KEYS = frozenset({"mac", "ip", "hostname", "fixed_ip", "wan_ip"})
+
 def mask_pii_data(data: T) -> T:
     """Recursively mask MAC addresses, IPs, and hostnames in data if mask_pii is enabled.
     
@@ -17,7 +20,7 @@ def mask_pii_data(data: T) -> T:
     Returns:
         The masked data
     """
-    if not settings.mask_pii:
+    if not get_settings().mask_pii:
         return data
         
     return _mask_recursive(data)
@@ -37,7 +40,7 @@ def _mask_recursive(data: Any) -> Any:
         new_dict = {}
         for k, v in data.items():
             # Sensitive keys to mask entirely
-            if k.lower() in ["mac", "ip", "hostname", "fixed_ip", "wan_ip"]:
+            if k.lower() in SENSITIVE_KEYS:
                 new_dict[k] = "[MASKED]"
             else:
                 new_dict[k] = _mask_recursive(v)
@@ -191,3 +191,59 @@ async def test_ensure_authenticated_triggers_login(local_auth):
         respx_mock.post(local_auth.settings.auth_url).mock(return_value=httpx.Response(200))
         await local_auth.ensure_authenticated()
         assert local_auth.is_authenticated
+
+@pytest.mark.asyncio
+async def test_request_headers_cached_until_login(local_auth):
+    """Test header dict is reused and rebuilt after the CSRF token changes."""
+    headers = local_auth.get_request_headers()
+    assert local_auth.get_request_headers() is headers
+    assert "X-CSRF-Token" not in headers
+    with respx.mock() as respx_mock:
+        respx_mock.post(local_auth.settings.auth_url).mock(
+            return_value=httpx.Response(200, headers={"X-CSRF-Token": "fresh"})
+        )
+        await local_auth.login()
+    assert local_auth.get_request_headers() is not headers
+    assert local_auth.get_request_headers()["X-CSRF-Token"] == "fresh"
+
+@pytest.mark.asyncio
+async def test_check_session_cached(local_auth):
+    """Test a valid session check is reused until logout resets it."""
+    local_auth._is_authenticated = True
+    with respx.mock() as respx_mock:
+        route = respx_mock.get(f"{local_auth.settings.api_base_url}/api/self").mock(
+            return_value=httpx.Response(200)
+        )
+        assert await local_auth.check_session() is True
+        assert await local_auth.check_session() is True
+        assert route.call_count == 1
+
+        respx_mock.post("https://unifi.local/api/auth/logout").mock(return_value=httpx.Response(200))
+        await local_auth.logout()
+        local_auth._is_authenticated = True
+        assert await local_auth.check_session() is True
+        assert route.call_count == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_single_login(local_auth):
+    """Test concurrent refreshes collapse into one login request."""
+    import asyncio
+
+    real_login = local_auth.login
+
+    async def slow_login():
+        # Yield like a real network round trip so the other refreshes queue on the lock
+        await asyncio.sleep(0)
+        return await real_login()
+
+    local_auth.login = slow_login
+    with respx.mock() as respx_mock:
+        route = respx_mock.post(local_auth.settings.auth_url).mock(return_value=httpx.Response(200))
+        results = await asyncio.gather(*(local_auth.refresh_session() for _ in range(5)))
+        assert all(results)
+        assert route.call_count == 1
+        assert local_auth._generation == 1
+
+        # A refresh requested after that one completed logs in again
+        assert await local_auth.refresh_session()
+        assert route.call_count == 2
@@ -4,7 +4,7 @@ import respx
 from cachetools import TTLCache
 from unittest.mock import MagicMock, AsyncMock, patch
 
-from unifi_mcp.clients.base import AppContext, UniFiHTTPClient, create_app_lifespan
+from unifi_mcp.clients.base import AppContext, UniFiHTTPClient, _endpoint_ttl, create_app_lifespan
 from unifi_mcp.config import UniFiSettings
 from unifi_mcp.exceptions import (
     UniFiAPIError,
@@ -108,11 +108,13 @@ async def test_parse_response_errors(mock_ctx_base):
         
     # Cloud error (194-198)
     mock_ctx_base.settings.mode = "cloud"
+    client = UniFiHTTPClient(mock_ctx_base)
     with pytest.raises(UniFiAPIError, match="Cloud Error"):
         client._parse_response(httpx.Response(200, json={"error": "Cloud Error"}))
         
     # Local meta error (203-204)
     mock_ctx_base.settings.mode = "local_api_key"
+    client = UniFiHTTPClient(mock_ctx_base)
     with pytest.raises(UniFiAPIError, match="Meta Error"):
         client._parse_response(httpx.Response(200, json={"meta": {"rc": "error", "msg": "Meta Error"}}))
 
@@ -129,13 +131,18 @@ async def test_handle_error_response(mock_ctx_base):
     with pytest.raises(UniFiAPIError, match="Something went wrong"):
         await client._handle_error_response(httpx.Response(500, json={"message": "Something went wrong"}))
 
+    # Non-JSON bodies are truncated rather than decoded in full
+    with pytest.raises(UniFiAPIError) as exc_info:
+        await client._handle_error_response(httpx.Response(502, content=b"<html>" + b"x" * 5000))
+    assert len(exc_info.value.args[0]) == 200
+
 @pytest.mark.asyncio
 async def test_lifespan_cloud(mock_ctx_base):
     """Test create_app_lifespan in cloud mode (lines 249-304)."""
     from unifi_mcp.config import UniFiSettings
     test_settings = UniFiSettings(mode="cloud", cloud_api_key="mykey")
     
-    with patch("unifi_mcp.clients.base.settings", test_settings):
+    with patch("unifi_mcp.clients.base.get_settings", return_value=test_settings):
         async with create_app_lifespan(MagicMock()) as ctx:
             assert ctx.settings.mode == "cloud"
             assert ctx.auth.api_key == "mykey"
@@ -146,7 +153,7 @@ async def test_lifespan_local_success():
     from unifi_mcp.config import UniFiSettings
     test_settings = UniFiSettings(mode="local", controller_url="https://u", username="u", password="p")
     
-    with patch("unifi_mcp.clients.base.settings", test_settings):
+    with patch("unifi_mcp.clients.base.get_settings", return_value=test_settings):
         with respx.mock() as respx_mock:
             # Mock login
             respx_mock.post("https://u/api/auth/login").mock(return_value=httpx.Response(200))
@@ -188,3 +195,156 @@ async def test_handle_401_error(mock_ctx_base):
     client = UniFiHTTPClient(mock_ctx_base)
     with pytest.raises(UniFiAuthError, match="Authentication required"):
         await client._handle_error_response(httpx.Response(401, content="Unauthorized"))
+
+@pytest.mark.asyncio
+async def test_make_request_retries_transient_errors(mock_ctx_base):
+    """Test connect errors are retried with backoff before succeeding."""
+    client = UniFiHTTPClient(mock_ctx_base)
+    url = f"{mock_ctx_base.settings.api_base_url}/test"
+
+    with respx.mock() as respx_mock, patch("unifi_mcp.clients.base.asyncio.sleep", new=AsyncMock()) as sleep:
+        route = respx_mock.get(url)
+        route.side_effect = [httpx.ConnectError("Fail"), httpx.Response(200, json={})]
+        response = await client._make_request("GET", url)
+        assert response.status_code == 200
+        assert route.call_count == 2
+        sleep.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_rate_limit_retry_after_honoured(mock_ctx_base):
+    """Test a short Retry-After is waited out and the request retried."""
+    client = UniFiHTTPClient(mock_ctx_base)
+    with respx.mock() as respx_mock, patch("unifi_mcp.clients.base.asyncio.sleep", new=AsyncMock()) as sleep:
+        respx_mock.get(f"{mock_ctx_base.settings.api_base_url}/test").side_effect = [
+            httpx.Response(429, headers={"Retry-After": "1"}),
+            httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []}),
+        ]
+        result = await client.request("GET", "/test")
+        assert result["data"] == []
+        sleep.assert_awaited_once_with(1)
+
+@pytest.mark.asyncio
+async def test_rate_limit_budget_exhausted(mock_ctx_base):
+    """Test UniFiRateLimitError surfaces once the retry budget is spent."""
+    client = UniFiHTTPClient(mock_ctx_base)
+    with respx.mock() as respx_mock, patch("unifi_mcp.clients.base.asyncio.sleep", new=AsyncMock()):
+        route = respx_mock.get(f"{mock_ctx_base.settings.api_base_url}/test").mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "1"})
+        )
+        with pytest.raises(UniFiRateLimitError) as excinfo:
+            await client.request("GET", "/test")
+        assert excinfo.value.retry_after == 1
+        assert route.call_count == mock_ctx_base.settings.rate_limit_retries + 1
+
+@pytest.mark.asyncio
+async def test_get_served_from_cache(mock_ctx_base):
+    """Test GET results are cached and reused until bypassed."""
+    client = UniFiHTTPClient(mock_ctx_base)
+    with respx.mock() as respx_mock:
+        route = respx_mock.get(f"{mock_ctx_base.settings.api_base_url}/test").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [{"mac": "aa"}]})
+        )
+        first = await client.get("/test", params={"a": 1})
+        second = await client.get("/test", params={"a": 1})
+        assert first is second
+        assert route.call_count == 1
+
+        await client.get("/test", params={"a": 1}, bypass_cache=True)
+        assert route.call_count == 2
+
+@pytest.mark.asyncio
+async def test_command_clears_cache(mock_ctx_base):
+    """Test a cmd/ POST drops cached GET responses for its site only."""
+    client = UniFiHTTPClient(mock_ctx_base)
+    mock_ctx_base.cache[("/api/s/default/stat/sta", frozenset())] = {"data": []}
+    mock_ctx_base.cache[("/api/s/other/stat/sta", frozenset())] = {"data": []}
+    with respx.mock() as respx_mock:
+        respx_mock.post(f"{mock_ctx_base.settings.api_base_url}/api/s/default/cmd/stamgr").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []})
+        )
+        await client.post("/api/s/default/cmd/stamgr", json={"cmd": "kick-sta"})
+    assert list(mock_ctx_base.cache) == [("/api/s/other/stat/sta", frozenset())]
+
+def test_endpoint_ttl():
+    """Test per-path cache lifetimes with a fallback to the default."""
+    assert _endpoint_ttl("/api/s/default/stat/health", 30) == 5
+    assert _endpoint_ttl("/api/s/default/rest/portconf", 30) == 60
+    assert _endpoint_ttl("/api/s/default/stat/device", 30) == 30
+    assert _endpoint_ttl("/v1/sites", 30) == 30
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_coalesced(mock_ctx_base):
+    """Test identical concurrent GETs share a single HTTP request."""
+    import asyncio
+
+    client = UniFiHTTPClient(mock_ctx_base)
+    with respx.mock() as respx_mock:
+        route = respx_mock.get(f"{mock_ctx_base.settings.api_base_url}/test").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [1]})
+        )
+        results = await asyncio.gather(*(client.get("/test") for _ in range(3)))
+        assert all(r["data"] == [1] for r in results)
+        assert route.call_count == 1
+        assert mock_ctx_base.inflight == {}
+
+@pytest.mark.asyncio
+async def test_closed_pool_warning(mock_ctx_base, caplog):
+    """Test a client built on a closed connection pool logs a warning."""
+    await mock_ctx_base.client.aclose()
+    with caplog.at_level("WARNING", logger="unifi_mcp.clients.base"):
+        UniFiHTTPClient(mock_ctx_base)
+    assert "Shared HTTP client is closed" in caplog.text
+
+@pytest.mark.asyncio
+async def test_json_body_encoded_with_orjson(mock_ctx_base):
+    """Test json= payloads are sent as pre-encoded content."""
+    client = UniFiHTTPClient(mock_ctx_base)
+    with respx.mock() as respx_mock:
+        route = respx_mock.post(f"{mock_ctx_base.settings.api_base_url}/api/s/default/cmd/devmgr").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []})
+        )
+        await client.post("/api/s/default/cmd/devmgr", json={"cmd": "restart", "mac": "aa:bb"})
+    assert route.calls.last.request.content == b'{"cmd":"restart","mac":"aa:bb"}'
+
+@pytest.mark.asyncio
+async def test_coalesced_get_fills_cache(mock_ctx_base):
+    """Test concurrent cache misses share one fetch that fills the cache."""
+    import asyncio
+
+    client = UniFiHTTPClient(mock_ctx_base)
+    with respx.mock() as respx_mock:
+        route = respx_mock.get(f"{mock_ctx_base.settings.api_base_url}/test").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [1]})
+        )
+        results = await asyncio.gather(*(client.get("/test") for _ in range(3)))
+        assert results[0] is results[1] is results[2]
+        assert mock_ctx_base.cache[("/test", frozenset())] is results[0]
+        assert route.call_count == 1
+        assert mock_ctx_base.inflight == {}
+
+@pytest.mark.asyncio
+async def test_get_fills_cache_while_plain_get_in_flight(mock_ctx_base):
+    """Test a cached get() doesn't join an uncached request("GET") in flight."""
+    import asyncio
+
+    client = UniFiHTTPClient(mock_ctx_base)
+    with respx.mock() as respx_mock:
+        route = respx_mock.get(f"{mock_ctx_base.settings.api_base_url}/test").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [1]})
+        )
+        await asyncio.gather(client.request("GET", "/test"), client.get("/test"))
+        assert ("/test", frozenset()) in mock_ctx_base.cache
+
+        await client.get("/test")
+        assert route.call_count == 2
+        assert mock_ctx_base.inflight == {}
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    """Test HTTP/2 is only offered when enabled and h2 is importable."""
+    import sys
+
+    from unifi_mcp.clients.base import _http2_enabled
+
+    assert not _http2_enabled(UniFiSettings(http2=False))
+    monkeypatch.setitem(sys.modules, "h2", None)
+    assert not _http2_enabled(UniFiSettings(http2=True))
@@ -1,6 +1,6 @@
 import pytest
 import json
-from unifi_mcp.config import UniFiSettings, UniFiDevice
+from unifi_mcp.config import UniFiSettings, UniFiDevice, get_settings
 
 
 def test_unifi_settings_auth_url():
@@ -15,6 +15,11 @@ def test_unifi_settings_auth_url():
     settings.is_udm = False
     assert settings.auth_url == "https://192.168.1.1/api/login"
 
+    # A trailing slash is dropped once, at validation
+    settings = UniFiSettings(controller_url="https://192.168.1.1/", mode="local")
+    assert settings.controller_url == "https://192.168.1.1"
+    assert settings.auth_url == "https://192.168.1.1/api/auth/login"
+
 
 def test_unifi_device_urls():
     """Test UniFiDevice URL properties."""
@@ -23,6 +28,20 @@ def test_unifi_device_urls():
     assert device.network_api_base == "https://10.0.0.1/proxy/network/integration"
     assert device.protect_api_base == "https://10.0.0.1/proxy/protect/integration/v1"
     assert device.protect_internal_api_base == "https://10.0.0.1/proxy/protect/api"
+    assert device.auth_url == "https://10.0.0.1/api/auth/login"
+    assert device.protect_api_base is device.protect_api_base
+
+    # Derived URLs follow a changed base URL
+    device.url = "https://10.0.0.2"
+    assert device.protect_api_base == "https://10.0.0.2/proxy/protect/integration/v1"
+
+    # Service and credential flags are cached the same way
+    assert device.has_network and not device.has_protect
+    assert not device.has_protect_credentials
+    device.services = frozenset({"protect"})
+    device.username, device.password = "admin", "secret"
+    assert device.has_protect and not device.has_network
+    assert device.has_protect_credentials
 
 
 def test_multi_device_config(monkeypatch):
@@ -39,3 +58,103 @@ def test_multi_device_config(monkeypatch):
     assert len(settings.devices) == 2
     assert settings.devices[0].name == "Device 1"
     assert settings.devices[1].name == "Device 2"
+    assert settings.devices[0].services == frozenset({"network"})
+
+    # Lookups are case-insensitive; no name means the first device
+    assert settings.get_device("device 2") is settings.devices[1]
+    assert settings.get_device() is settings.devices[0]
+    assert settings.get_device("missing") is None
+
+    # Per-service views are built once with the device list
+    assert settings.get_device_names() == ["Device 1", "Device 2"]
+    assert settings.get_network_devices() is settings.get_network_devices()
+    assert settings.get_protect_devices() == []
+
+    payload = settings.devices_payload()
+    assert payload["total_devices"] == 2
+    assert payload["devices"][0]["services"] == ["network"]
+    assert payload["network_devices"] == ["Device 1", "Device 2"]
+    assert settings.devices_payload() is payload
+
+
+
+def test_devices_json_list_and_malformed(monkeypatch):
+    """Test devices given as a list round-trip and bad JSON yields no devices."""
+    settings = UniFiSettings(UNIFI_DEVICES=[{"name": "Lab", "url": "https://lab", "api_key": "k"}])
+    assert settings.devices_json is None  # kept as a list, not re-serialised
+    assert [d.name for d in settings.devices] == ["Lab"]
+
+    monkeypatch.setenv("UNIFI_DEVICES", "[{not json")
+    assert UniFiSettings().devices == []
+
+
+def test_large_devices_json(monkeypatch):
+    """Test a payload above the streaming threshold parses every device."""
+    devices = [
+        {"name": f"Site {i}", "url": f"https://10.0.{i}.1", "api_key": "k" * 64, "services": ["network", "protect"]}
+        for i in range(60)
+    ]
+    devices_json = json.dumps(devices)
+    assert len(devices_json) > 4096
+    monkeypatch.setenv("UNIFI_DEVICES", devices_json)
+
+    settings = UniFiSettings()
+    assert len(settings.devices) == 60
+    assert settings.devices[-1].name == "Site 59"
+    assert settings.devices[-1].has_protect
+
+
+def test_truncated_large_devices_json(monkeypatch):
+    """Test a truncated streamed payload loads no devices, like a short one."""
+    devices = [
+        {"name": f"Site {i}", "url": f"https://10.0.{i}.1", "api_key": "k" * 64}
+        for i in range(60)
+    ]
+    devices_json = json.dumps(devices)[:-200]
+    assert len(devices_json) > 4096
+    monkeypatch.setenv("UNIFI_DEVICES", devices_json)
+
+    settings = UniFiSettings()
+    assert settings.devices == []
+
+    # The legacy single-device config still applies
+    settings.controller_url = "https://legacy"
+    settings.cloud_api_key = "key"
+    assert [d.url for d in settings.devices] == ["https://legacy"]
+
+
+def test_devices_rebuilt_after_field_change(monkeypatch):
+    """Test the memoized device list follows later field assignments."""
+    monkeypatch.delenv("UNIFI_DEVICES", raising=False)
+    settings = UniFiSettings(UNIFI_DEVICES=[{"name": "Lab", "url": "https://lab", "api_key": "k"}])
+    assert settings.get_device_names() == ["Lab"]
+    payload = settings.devices_payload()
+
+    settings.devices_json = json.dumps([{"name": "Office", "url": "https://office", "api_key": "k"}])
+    assert settings.get_device_names() == ["Office"]
+    assert settings.get_device("lab") is None
+    assert settings.devices_payload() is not payload
+
+    settings.devices_json = None
+    assert settings.devices == []
+    settings.controller_url = "https://legacy"
+    settings.cloud_api_key = "key"
+    assert [d.url for d in settings.get_network_devices()] == ["https://legacy"]
+
+def test_get_settings_is_lazy_and_cached(monkeypatch):
+    """Settings load on first access and are reused until the cache is cleared."""
+    import unifi_mcp.config as config
+
+    get_settings.cache_clear()
+    monkeypatch.setenv("UNIFI_MODE", "cloud")
+    try:
+        first = get_settings()
+        assert first.mode == "cloud"
+        assert get_settings() is first
+        assert config.settings is first
+
+        get_settings.cache_clear()
+        monkeypatch.setenv("UNIFI_MODE", "local")
+        assert get_settings().mode == "local"
+    finally:
+        get_settings.cache_clear()
@@ -136,3 +136,379 @@ async def test_get_site_health_integration(mock_ctx):
         assert health[0]["status"] == "degraded"
         assert health[0]["devices_online"] == 1
         assert health[0]["devices_offline"] == 1
+        assert health[0]["device_states"] == {"ONLINE": 1, "OFFLINE": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_device_reuses_mac_index(mock_ctx):
+    """Test repeated device lookups share one MAC index."""
+    client = UniFiNetworkClient(mock_ctx)
+    client._site_id_cache["default"] = "site-id-1"
+
+    devices_data = [
+        {"mac": "00:11:22:33:44:55", "name": "AP-Living"},
+        {"mac": "66:77:88:99:AA:BB", "name": "Switch"},
+    ]
+
+    with respx.mock(base_url=mock_ctx.settings.api_base_url) as respx_mock:
+        route = respx_mock.get("/v1/sites/site-id-1/devices").mock(
+            return_value=httpx.Response(200, json={"data": devices_data})
+        )
+
+        assert (await client.get_device("00-11-22-33-44-55"))["name"] == "AP-Living"
+        index = mock_ctx.cache[("/api/s/default/", "mac_index", "devices")][1]
+        assert (await client.get_device("66778899aabb"))["name"] == "Switch"
+        assert mock_ctx.cache[("/api/s/default/", "mac_index", "devices")][1] is index
+        assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_devices_by_macs(mock_ctx):
+    """Test batch device lookup uses a single devices fetch."""
+    client = UniFiNetworkClient(mock_ctx)
+    client._site_id_cache["default"] = "site-id-1"
+
+    devices_data = [
+        {"mac": "00:11:22:33:44:55", "name": "AP-Living"},
+        {"mac": "66:77:88:99:AA:BB", "name": "Switch"},
+    ]
+
+    with respx.mock(base_url=mock_ctx.settings.api_base_url) as respx_mock:
+        route = respx_mock.get("/v1/sites/site-id-1/devices").mock(
+            return_value=httpx.Response(200, json={"data": devices_data})
+        )
+
+        result = await client.get_devices_by_macs(
+            ["00-11-22-33-44-55", "66:77:88:99:aa:bb", "ff:ff:ff:ff:ff:ff"]
+        )
+
+        assert result["001122334455"]["name"] == "AP-Living"
+        assert result["66778899aabb"]["name"] == "Switch"
+        assert result["ffffffffffff"] is None
+        assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_site_ids_resolved_in_bulk(mock_ctx):
+    """Test one sites fetch resolves every site and can be invalidated."""
+    client = UniFiNetworkClient(mock_ctx)
+
+    sites_data = [
+        {"id": "site-id-1", "name": "Default", "internalReference": "default"},
+        {"id": "site-id-2", "name": "Home", "internalReference": "home"},
+    ]
+
+    with respx.mock(base_url=mock_ctx.settings.api_base_url) as respx_mock:
+        route = respx_mock.get("/v1/sites").mock(
+            return_value=httpx.Response(200, json={"data": sites_data})
+        )
+
+        assert await client._get_site_id("default") == "site-id-1"
+        assert await UniFiNetworkClient(mock_ctx)._get_site_id("Home") == "site-id-2"
+        assert route.call_count == 1
+
+        with pytest.raises(UniFiNotFoundError):
+            await client._get_site_id("missing")
+        assert route.call_count == 1
+
+        client.invalidate_sites_cache()
+        assert mock_ctx.site_ids == {}
+        assert await client._get_site_id("home") == "site-id-2"
+        assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_events_pages(mock_ctx):
+    """Test events are paged with _start/_limit until the total is reached."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    def page(request):
+        start = int(request.url.params["_start"])
+        limit = int(request.url.params["_limit"])
+        events = [{"key": f"evt-{i}"} for i in range(start, min(start + limit, 5))]
+        return httpx.Response(200, json={"meta": {"rc": "ok"}, "data": events})
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        route = respx_mock.get("/api/s/default/stat/event").mock(side_effect=page)
+
+        events = [e async for e in client.iter_events(4, page_size=2)]
+        assert [e["key"] for e in events] == ["evt-0", "evt-1", "evt-2", "evt-3"]
+        assert route.call_count == 2
+
+        events = [e async for e in client.iter_events(10, page_size=2)]
+        assert len(events) == 5
+        assert route.call_count == 5
+        # Page fragments are never kept in the response cache
+        assert len(mock_ctx.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_site_snapshot(mock_ctx):
+    """Test the snapshot fetches parts together and reports failures per part."""
+    client = UniFiNetworkClient(mock_ctx)
+    client._site_id_cache["default"] = "site-id-1"
+
+    with respx.mock(base_url=mock_ctx.settings.api_base_url) as respx_mock:
+        devices_route = respx_mock.get("/v1/sites/site-id-1/devices").mock(
+            return_value=httpx.Response(200, json={"data": [{"mac": "aa", "state": "ONLINE"}]})
+        )
+        respx_mock.get("/v1/sites/site-id-1/clients").mock(
+            return_value=httpx.Response(200, json={"data": [{"mac": "bb"}]})
+        )
+        respx_mock.get("/v1/sites/site-id-1/networks").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+        respx_mock.get("/api/s/default/stat/sysinfo").mock(
+            return_value=httpx.Response(404, json={"error": "Not found"})
+        )
+
+        snapshot = await client.get_site_snapshot()
+
+        assert snapshot["devices"] == [{"mac": "aa", "state": "ONLINE"}]
+        assert snapshot["clients"] == [{"mac": "bb"}]
+        assert snapshot["wlans"] == []
+        assert snapshot["health"][0]["devices_online"] == 1
+        assert snapshot["sysinfo"] is None
+        assert list(snapshot["errors"]) == ["sysinfo"]
+        assert devices_route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_site_id_resolution(mock_ctx):
+    """Test concurrent site lookups share one resolution."""
+    import asyncio
+
+    sites_data = [{"id": "site-id-1", "name": "Default", "internalReference": "default"}]
+
+    with respx.mock(base_url=mock_ctx.settings.api_base_url) as respx_mock:
+        route = respx_mock.get("/v1/sites").mock(
+            return_value=httpx.Response(200, json={"data": sites_data})
+        )
+
+        ids = await asyncio.gather(
+            *(UniFiNetworkClient(mock_ctx)._get_site_id("default") for _ in range(5))
+        )
+
+        assert ids == ["site-id-1"] * 5
+        assert route.call_count == 1
+        assert mock_ctx.inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_stream_events(mock_ctx):
+    """Test events are streamed item by item from the response body."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    events_data = [{"key": "evt-0"}, {"key": "evt-1"}]
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        respx_mock.get("/api/s/default/stat/event").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": events_data})
+        )
+
+        events = [e async for e in client.stream_events(2)]
+
+        assert events == events_data
+
+
+@pytest.mark.asyncio
+async def test_get_device_direct_lookup(mock_ctx):
+    """Test local mode fetches one device by MAC and falls back to the list."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        respx_mock.get("/api/s/default/stat/device/00:11:22:33:44:55").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [{"mac": "00:11:22:33:44:55", "name": "AP"}]})
+        )
+        respx_mock.get("/api/s/default/stat/device/66:77:88:99:aa:bb").mock(
+            return_value=httpx.Response(400, json={"meta": {"rc": "error", "msg": "api.err.UnknownDevice"}})
+        )
+        list_route = respx_mock.get("/api/s/default/stat/device").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [{"mac": "66:77:88:99:aa:bb", "name": "Switch"}]})
+        )
+
+        assert (await client.get_device("00-11-22-33-44-55"))["name"] == "AP"
+        assert list_route.call_count == 0
+
+        assert (await client.get_device("66:77:88:99:AA:BB"))["name"] == "Switch"
+        assert list_route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_stamgr_commands(mock_ctx):
+    """Test forget-sta is sent once for several MACs and kicks fan out per MAC."""
+    import json
+
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        route = respx_mock.post("/api/s/default/cmd/stamgr").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []})
+        )
+
+        result = await client.forget_clients(["AA:BB:CC:DD:EE:01", "aa:bb:cc:dd:ee:02"])
+        assert result == {"AA:BB:CC:DD:EE:01": True, "aa:bb:cc:dd:ee:02": True}
+        assert route.call_count == 1
+        assert json.loads(route.calls.last.request.content)["macs"] == [
+            "aa:bb:cc:dd:ee:01", "aa:bb:cc:dd:ee:02"
+        ]
+
+        result = await client.kick_clients(["aa:bb:cc:dd:ee:01", "aa:bb:cc:dd:ee:02"])
+        assert all(result.values())
+        assert route.call_count == 3
+
+        assert await client.forget_clients([]) == {}
+        assert await client.kick_clients([]) == {}
+        assert route.call_count == 3
+
+        await client.forget_client("AA:BB:CC:DD:EE:03")
+        assert route.call_count == 4
+        assert json.loads(route.calls.last.request.content) == {
+            "cmd": "forget-sta", "mac": "aa:bb:cc:dd:ee:03"
+        }
+
+
+
+@pytest.mark.asyncio
+async def test_bulk_stamgr_partial_failure(mock_ctx):
+    """Test one rejected MAC is reported as failed while the others succeed."""
+    import json
+
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    def respond(request):
+        if json.loads(request.content)["mac"] == "aa:bb:cc:dd:ee:02":
+            return httpx.Response(200, json={"meta": {"rc": "error", "msg": "api.err.UnknownStation"}})
+        return httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []})
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        route = respx_mock.post("/api/s/default/cmd/stamgr").mock(side_effect=respond)
+
+        result = await client.kick_clients(
+            ["aa:bb:cc:dd:ee:01", "aa:bb:cc:dd:ee:02", "aa:bb:cc:dd:ee:03"]
+        )
+
+    assert result == {
+        "aa:bb:cc:dd:ee:01": True,
+        "aa:bb:cc:dd:ee:02": False,
+        "aa:bb:cc:dd:ee:03": True,
+    }
+    assert route.call_count == 3
+
+@pytest.mark.asyncio
+async def test_get_device_uses_cached_list(mock_ctx):
+    """Test a warm devices list answers get_device without any request."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    # direct_route must stay uncalled, so don't require every route to be hit
+    with respx.mock(base_url=base_url, assert_all_called=False) as respx_mock:
+        list_route = respx_mock.get("/api/s/default/stat/device").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [{"mac": "00:11:22:33:44:55", "name": "AP"}]})
+        )
+        direct_route = respx_mock.get("/api/s/default/stat/device/00:11:22:33:44:55")
+
+        await client.get_devices()
+        assert (await client.get_device("00:11:22:33:44:55"))["name"] == "AP"
+        assert list_route.call_count == 1
+        assert direct_route.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_config_bundle(mock_ctx):
+    """Test the config bundle fetches every part and reports failed ones."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    ok = httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [{"name": "x"}]})
+    with respx.mock(base_url=base_url) as respx_mock:
+        for path in ("rest/networkconf", "rest/wlanconf", "rest/portconf", "rest/firewallrule"):
+            respx_mock.get(f"/api/s/default/{path}").mock(return_value=ok)
+        respx_mock.get("/api/s/default/stat/routing").mock(
+            return_value=httpx.Response(500, json={"meta": {"rc": "error", "msg": "boom"}})
+        )
+
+        bundle = await client.get_config_bundle()
+
+        assert bundle.networks == [{"name": "x"}]
+        assert bundle.firewall_rules == [{"name": "x"}]
+        assert bundle.routes == []
+        assert list(bundle.errors) == ["routes"]
+
+
+@pytest.mark.asyncio
+async def test_iter_all_clients_stops_when_paging_ignored(mock_ctx):
+    """Test paging stops when the controller ignores _start/_limit."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    everything = [{"mac": f"aa:bb:cc:dd:ee:{i:02x}"} for i in range(3)]
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        route = respx_mock.get("/api/s/default/stat/alluser").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": everything})
+        )
+
+        clients = [c async for c in client.iter_all_clients(page_size=2)]
+
+        assert clients == everything
+        assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_block_client_invalidates_narrowly(mock_ctx):
+    """Test blocking drops connected clients only and patches known clients."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    known = {"meta": {"rc": "ok"}, "data": [{"mac": "aa:bb:cc:dd:ee:ff", "blocked": False}]}
+    mock_ctx.cache[("/api/s/default/stat/alluser", frozenset())] = known
+    mock_ctx.cache[("/api/s/default/stat/sta", frozenset())] = {"data": []}
+    mock_ctx.cache[("/api/s/default/stat/device", frozenset())] = {"data": []}
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        respx_mock.post("/api/s/default/cmd/stamgr").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []})
+        )
+        await client.block_client("AA:BB:CC:DD:EE:FF")
+
+    assert ("/api/s/default/stat/sta", frozenset()) not in mock_ctx.cache
+    assert ("/api/s/default/stat/device", frozenset()) in mock_ctx.cache
+    assert mock_ctx.cache[("/api/s/default/stat/alluser", frozenset())] is known
+    assert known["data"][0]["blocked"] is True
+
+
+@pytest.mark.asyncio
+async def test_speed_test_status_keeps_cache(mock_ctx):
+    """Test polling speed test status leaves cached device data in place."""
+    base_url = mock_ctx.settings.api_base_url
+    mock_ctx.settings.mode = "local"
+    client = UniFiNetworkClient(mock_ctx)
+
+    mock_ctx.cache[("/api/s/default/stat/device", frozenset())] = {"data": []}
+    mock_ctx.cache[("/api/s/default/stat/health", frozenset())] = {"data": []}
+
+    with respx.mock(base_url=base_url) as respx_mock:
+        respx_mock.post("/api/s/default/cmd/devmgr").mock(
+            return_value=httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []})
+        )
+        await client.get_speed_test_status()
+        assert ("/api/s/default/stat/device", frozenset()) in mock_ctx.cache
+        assert ("/api/s/default/stat/health", frozenset()) in mock_ctx.cache
+
+        await client.run_speed_test()
+        assert ("/api/s/default/stat/device", frozenset()) not in mock_ctx.cache
@@ -1,3 +1,5 @@
+import asyncio
+import base64
 import pytest
 import respx
 import httpx
@@ -36,6 +38,124 @@ async def test_get_camera_by_name(mock_protect_client):
             await mock_protect_client.get_camera_by_name("non-existent")
 
 
+@pytest.mark.asyncio
+async def test_listings_cached_across_clients(mock_protect_client):
+    """Test listings are reused across clients sharing a cache."""
+    cache = {}
+    first = UniFiProtectClient(mock_protect_client.client, mock_protect_client.device, cache=cache)
+    second = UniFiProtectClient(mock_protect_client.client, mock_protect_client.device, cache=cache)
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        route = respx_mock.get("/cameras").mock(
+            return_value=httpx.Response(200, json=[{"id": "cam-1", "name": "Front Door"}])
+        )
+
+        await first.get_cameras()
+        await second.get_camera_by_name("front")
+        assert route.call_count == 1
+
+        first._invalidate()
+        await second.get_cameras()
+        assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_listings_share_one_request(mock_protect_client):
+    """Test concurrent cache misses coalesce onto a single fetch."""
+    cache, inflight = {}, {}
+    clients = [
+        UniFiProtectClient(
+            mock_protect_client.client, mock_protect_client.device, cache=cache, inflight=inflight
+        )
+        for _ in range(3)
+    ]
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        route = respx_mock.get("/cameras").mock(
+            return_value=httpx.Response(200, json=[{"id": "cam-1", "name": "Front Door"}])
+        )
+
+        results = await asyncio.gather(*(c.get_cameras() for c in clients))
+
+    assert route.call_count == 1
+    assert all(r == results[0] for r in results)
+    assert not inflight
+
+
+@pytest.mark.asyncio
+async def test_expired_listing_revalidated_with_etag(mock_protect_client):
+    """Test an expired listing is revalidated and reused on 304."""
+    cameras_data = [{"id": "cam-1", "name": "Front Door"}]
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        route = respx_mock.get("/cameras").mock(
+            side_effect=[
+                httpx.Response(200, json=cameras_data, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+
+        first = await mock_protect_client.get_cameras()
+        key = (mock_protect_client.base_url, "/cameras")
+        _, data, etag = mock_protect_client._cache[key]
+        mock_protect_client._cache[key] = (0.0, data, etag)
+
+        second = await mock_protect_client.get_cameras()
+
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_get_camera_by_name_prefers_exact(mock_protect_client):
+    """Test an exact name match wins over an earlier partial match."""
+    cameras_data = [
+        {"id": "cam-1", "name": "Front Door"},
+        {"id": "cam-2", "name": "Front"},
+    ]
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        respx_mock.get("/cameras").mock(return_value=httpx.Response(200, json=cameras_data))
+
+        assert (await mock_protect_client.get_camera_by_name("FRONT"))["id"] == "cam-2"
+        assert (await mock_protect_client.get_camera_by_name("door"))["id"] == "cam-1"
+
+
+@pytest.mark.asyncio
+async def test_get_system_info_fetches_listings_concurrently(mock_protect_client):
+    """Test system info requests all listings before any of them answers."""
+    pending = 0
+    peak = 0
+
+    async def slow(data):
+        nonlocal pending, peak
+        pending += 1
+        peak = max(peak, pending)
+        await asyncio.sleep(0.01)
+        pending -= 1
+        return httpx.Response(200, json=data)
+
+    listings = {
+        "/cameras": [{"id": "cam-1", "state": "CONNECTED"}, {"id": "cam-2", "state": "OFFLINE"}],
+        "/lights": [{"id": "light-1"}],
+        "/sensors": [],
+        "/chimes": [],
+        "/viewers": [],
+        "/liveviews": [{"id": "lv-1"}],
+    }
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        for path, data in listings.items():
+            respx_mock.get(path).mock(side_effect=lambda request, data=data: slow(data))
+
+        info = await mock_protect_client.get_system_info()
+
+    assert peak == len(listings)
+    assert info["cameras"] == {"total": 2, "connected": 1, "disconnected": 1}
+    assert info["accessories"]["lights"] == 1
+    assert info["liveviews"] == 1
+
+
 @pytest.mark.asyncio
 async def test_get_camera_snapshot(mock_protect_client):
     """Test getting camera snapshot bytes."""
@@ -48,6 +168,53 @@ async def test_get_camera_snapshot(mock_protect_client):
         assert snapshot == b"fake-jpeg-data"
 
 
+@pytest.mark.asyncio
+async def test_snapshot_reused_for_rapid_repeats(mock_protect_client):
+    """Test repeat snapshot requests within the TTL reuse the image."""
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        route = respx_mock.get("/cameras/cam-1/snapshot").mock(
+            return_value=httpx.Response(200, content=b"fake-jpeg-data")
+        )
+
+        first = await mock_protect_client.get_camera_snapshot("cam-1")
+        second = await mock_protect_client.get_camera_snapshot("cam-1")
+        encoded = await mock_protect_client.get_camera_snapshot_base64("cam-1")
+
+    assert first == second == b"fake-jpeg-data"
+    assert encoded == base64.b64encode(b"fake-jpeg-data").decode()
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_snapshots(mock_protect_client):
+    """Test snapshots from several cameras are returned by camera ID."""
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        for cid in ("cam-1", "cam-2", "cam-3"):
+            respx_mock.get(f"/cameras/{cid}/snapshot").mock(
+                return_value=httpx.Response(200, content=cid.encode())
+            )
+
+        snapshots = await mock_protect_client.get_snapshots(
+            ["cam-1", "cam-2", "cam-3", "cam-1"], concurrency=2
+        )
+
+    assert snapshots == {"cam-1": b"cam-1", "cam-2": b"cam-2", "cam-3": b"cam-3"}
+
+
+@pytest.mark.asyncio
+async def test_get_camera_snapshot_base64(mock_protect_client):
+    """Test the streamed base64 snapshot matches encoding the whole image."""
+    image = bytes(range(256)) * 1000 + b"x"
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        respx_mock.get("/cameras/cam-1/snapshot").mock(
+            return_value=httpx.Response(200, content=image)
+        )
+
+        encoded = await mock_protect_client.get_camera_snapshot_base64("cam-1")
+        assert encoded == base64.b64encode(image).decode()
+
+
 @pytest.mark.asyncio
 async def test_session_auth_flow(mock_protect_client):
     """Test the session authentication flow for internal API."""
@@ -81,7 +248,7 @@ async def test_get_motion_events(mock_protect_client):
         )
 
         # Mock events
-        respx_mock.get(f"{mock_protect_client.internal_base_url}/events").mock(
+        route = respx_mock.get(f"{mock_protect_client.internal_base_url}/events").mock(
             return_value=httpx.Response(200, json=events_data)
         )
 
@@ -89,6 +256,76 @@ async def test_get_motion_events(mock_protect_client):
         assert len(events) == 1
         assert events[0]["type"] == "motion"
 
+        # The query window is exactly one hour of epoch milliseconds
+        params = route.calls.last.request.url.params
+        assert int(params["end"]) - int(params["start"]) == 3_600_000
+        assert params["types"] == "motion"
+
+
+@pytest.mark.asyncio
+async def test_get_smart_detection_events_filters_types(mock_protect_client):
+    """Test smart detections are narrowed to the requested types."""
+    events_data = [
+        {"id": "e1", "smartDetectTypes": ["person"]},
+        {"id": "e2", "smartDetectTypes": ["vehicle", "animal"]},
+        {"id": "e3", "smartDetectTypes": None},
+        {"id": "e4"},
+    ]
+
+    with respx.mock() as respx_mock:
+        respx_mock.post(f"{mock_protect_client.device.url}/api/auth/login").mock(
+            return_value=httpx.Response(200, headers={"X-CSRF-Token": "token"})
+        )
+        respx_mock.get(f"{mock_protect_client.internal_base_url}/events").mock(
+            return_value=httpx.Response(200, json=events_data)
+        )
+
+        events = await mock_protect_client.get_smart_detection_events(
+            detection_types=["animal", "package"]
+        )
+        assert [e["id"] for e in events] == ["e2"]
+
+
+@pytest.mark.asyncio
+async def test_warmup_logs_in_and_swallows_auth_failure(mock_protect_client):
+    """Test warmup establishes the session and never raises, even on timeouts."""
+    login_url = f"{mock_protect_client.device.url}/api/auth/login"
+
+    with respx.mock() as respx_mock:
+        respx_mock.post(login_url).mock(return_value=httpx.Response(401))
+        await mock_protect_client.warmup()
+        assert not mock_protect_client._session_authenticated
+
+        respx_mock.post(login_url).mock(side_effect=httpx.ReadTimeout("slow"))
+        await mock_protect_client.warmup()
+        assert not mock_protect_client._session_authenticated
+
+        respx_mock.post(login_url).mock(
+            return_value=httpx.Response(200, headers={"X-CSRF-Token": "token"})
+        )
+        await mock_protect_client.warmup()
+        assert mock_protect_client._session_authenticated
+        assert mock_protect_client._csrf_token == "token"
+
+
+@pytest.mark.asyncio
+async def test_event_thumbnail_base64_renews_expired_session(mock_protect_client):
+    """Test the streamed thumbnail re-authenticates once on a 401."""
+    image = bytes(range(256)) * 10
+
+    with respx.mock() as respx_mock:
+        login_route = respx_mock.post(f"{mock_protect_client.device.url}/api/auth/login").mock(
+            return_value=httpx.Response(200, headers={"X-CSRF-Token": "token"})
+        )
+        respx_mock.get(f"{mock_protect_client.internal_base_url}/events/event-1/thumbnail").mock(
+            side_effect=[httpx.Response(401), httpx.Response(200, content=image)]
+        )
+
+        encoded = await mock_protect_client.get_event_thumbnail_base64("event-1")
+
+    assert encoded == base64.b64encode(image).decode()
+    assert login_route.call_count == 2
+
 
 @pytest.mark.asyncio
 async def test_auth_failure(mock_protect_client):
@@ -100,3 +337,149 @@ async def test_auth_failure(mock_protect_client):
 
         with pytest.raises(UniFiAuthError):
             await mock_protect_client._ensure_session_auth()
+
+
+@pytest.mark.asyncio
+async def test_aclose_only_closes_owned_client(mock_protect_client):
+    """A shared pool survives the context manager; an owned one is closed."""
+    async with UniFiProtectClient(mock_protect_client.client, mock_protect_client.device):
+        pass
+    assert not mock_protect_client.client.is_closed
+
+    owned = httpx.AsyncClient()
+    async with UniFiProtectClient(owned, mock_protect_client.device, owns_client=True):
+        pass
+    assert owned.is_closed
+
+
+def test_protect_url_is_parsed_once():
+    """Endpoint URLs keep the base path and are reused between calls."""
+    from unifi_mcp.clients.protect import _protect_url
+
+    url = _protect_url("https://nvr/proxy/protect/integration/v1", "/cameras")
+    assert str(url) == "https://nvr/proxy/protect/integration/v1/cameras"
+    assert _protect_url("https://nvr/proxy/protect/integration/v1", "/cameras") is url
+
+
+@pytest.mark.asyncio
+async def test_camera_summary_keeps_only_summary_fields(mock_protect_client):
+    """Test the summary counts states and drops heavy per-camera fields."""
+    cameras_data = [
+        {"id": "cam-1", "name": "Front", "state": "CONNECTED", "channels": [{"id": 0}] * 3},
+        {"id": "cam-2", "name": "Back", "state": "DISCONNECTED", "featureFlags": {"hasMic": True}},
+    ]
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        respx_mock.get("/cameras").mock(return_value=httpx.Response(200, json=cameras_data))
+
+        summary = await mock_protect_client.get_camera_summary()
+
+    assert summary["connected"] == 1
+    assert summary["disconnected"] == 1
+    assert [c["id"] for c in summary["cameras"]] == ["cam-1", "cam-2"]
+    assert "channels" not in summary["cameras"][0]
+
+
+@pytest.mark.asyncio
+async def test_recent_activity_reuses_camera_names(mock_protect_client):
+    """Test camera names outlive the short listing cache."""
+    events = [
+        {"id": "event-1", "type": "motion", "camera": "cam-1", "start": 0},
+        {"id": "event-2", "type": "motion", "camera": "cam-2", "start": 0},
+    ]
+
+    with respx.mock() as respx_mock:
+        respx_mock.post(f"{mock_protect_client.device.url}/api/auth/login").mock(
+            return_value=httpx.Response(200, headers={"X-CSRF-Token": "token"})
+        )
+        respx_mock.get(f"{mock_protect_client.internal_base_url}/events").mock(
+            return_value=httpx.Response(200, json=events)
+        )
+        cameras_route = respx_mock.get(f"{mock_protect_client.base_url}/cameras").mock(
+            return_value=httpx.Response(200, json=[{"id": "cam-1", "name": "Front Door"}, {"id": "cam-2"}])
+        )
+
+        first = await mock_protect_client.get_recent_activity()
+        mock_protect_client._cache.pop((mock_protect_client.base_url, "/cameras"))
+        second = await mock_protect_client.get_recent_activity()
+        assert cameras_route.call_count == 1
+
+        await mock_protect_client.get_recent_activity(refresh=True)
+        assert cameras_route.call_count == 2
+
+    assert first[0]["camera"] == second[0]["camera"] == "Front Door"
+    # A camera without a name is labelled by its ID
+    assert first[1]["camera"] == "cam-2"
+
+
+@pytest.mark.asyncio
+async def test_event_summary_counts(mock_protect_client):
+    """Test events are tallied by type and smart detection kind."""
+    events = [
+        {"type": "motion", "camera": "cam-1"},
+        {"type": "smartDetectZone", "camera": "cam-2"},
+        {"type": "smartDetect", "camera": "cam-2", "smartDetectTypes": ["person", "face"]},
+        {"type": "smartDetect", "camera": "cam-1", "smartDetectTypes": ["vehicle", "person"]},
+        {"type": "ring", "camera": "cam-3"},
+    ]
+
+    with respx.mock() as respx_mock:
+        respx_mock.post(f"{mock_protect_client.device.url}/api/auth/login").mock(
+            return_value=httpx.Response(200, headers={"X-CSRF-Token": "token"})
+        )
+        respx_mock.get(f"{mock_protect_client.internal_base_url}/events").mock(
+            return_value=httpx.Response(200, json=events)
+        )
+
+        summary = await mock_protect_client.get_event_summary(hours=1)
+
+    assert summary["total_events"] == 5
+    assert summary["motion_events"] == 1
+    assert summary["smart_detections"] == 2
+    assert summary["doorbell_rings"] == 1
+    assert summary["other_events"] == 1
+    assert summary["smart_detection_breakdown"] == {
+        "person": 2, "vehicle": 1, "animal": 0, "package": 0,
+    }
+    assert summary["cameras_with_activity"] == 3
+
+
+@pytest.mark.asyncio
+async def test_find_camera_uses_listing(mock_protect_client):
+    """Test IDs and names resolve from the listing without a direct lookup."""
+    cameras_data = [
+        {"id": "cam-1", "name": "Front Door"},
+        {"id": "cam-2", "name": "Backyard"},
+    ]
+
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        respx_mock.get("/cameras").mock(return_value=httpx.Response(200, json=cameras_data))
+        direct = respx_mock.get("/cameras/cam-9").mock(
+            return_value=httpx.Response(200, json={"id": "cam-9", "name": "New"})
+        )
+
+        assert (await mock_protect_client.find_camera("cam-2"))["name"] == "Backyard"
+        assert (await mock_protect_client.find_camera("front door"))["id"] == "cam-1"
+        assert (await mock_protect_client.find_camera("yard"))["id"] == "cam-2"
+        assert not direct.called
+
+        assert (await mock_protect_client.find_camera("cam-9"))["name"] == "New"
+        assert direct.called
+
+        respx_mock.get("/cameras/Garage").mock(return_value=httpx.Response(404))
+        with pytest.raises(UniFiNotFoundError, match="Camera not found: Garage"):
+            await mock_protect_client.find_camera("Garage")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request(mock_protect_client):
+    """Test identical concurrent direct GETs are coalesced."""
+    with respx.mock(base_url=mock_protect_client.base_url) as respx_mock:
+        route = respx_mock.get("/cameras/cam-1").mock(
+            return_value=httpx.Response(200, json={"id": "cam-1"})
+        )
+
+        results = await asyncio.gather(*(mock_protect_client.get_camera("cam-1") for _ in range(3)))
+
+    assert route.call_count == 1
+    assert all(r == {"id": "cam-1"} for r in results)
@@ -21,9 +21,10 @@ async def test_get_smart_detections(mock_mcp_context):
     )
 
     with (
-        patch("unifi_mcp.tools.protect.cameras.settings") as mock_settings,
+        patch("unifi_mcp.tools.protect.cameras.get_settings") as mock_get_settings,
         patch("unifi_mcp.tools.protect.cameras.UniFiProtectClient") as mock_client_class,
     ):
+        mock_settings = mock_get_settings.return_value
         mock_settings.get_protect_devices.return_value = [mock_device]
         mock_settings.default_device_name = "test-protect"
 
@@ -61,9 +62,10 @@ async def test_get_event_summary(mock_mcp_context):
     )
 
     with (
-        patch("unifi_mcp.tools.protect.cameras.settings") as mock_settings,
+        patch("unifi_mcp.tools.protect.cameras.get_settings") as mock_get_settings,
         patch("unifi_mcp.tools.protect.cameras.UniFiProtectClient") as mock_client_class,
     ):
+        mock_settings = mock_get_settings.return_value
         mock_settings.get_protect_devices.return_value = [mock_device]
         mock_settings.default_device_name = "test-protect"
 
@@ -90,9 +92,10 @@ async def test_get_recent_activity(mock_mcp_context):
     )
 
     with (
-        patch("unifi_mcp.tools.protect.cameras.settings") as mock_settings,
+        patch("unifi_mcp.tools.protect.cameras.get_settings") as mock_get_settings,
         patch("unifi_mcp.tools.protect.cameras.UniFiProtectClient") as mock_client_class,
     ):
+        mock_settings = mock_get_settings.return_value
         mock_settings.get_protect_devices.return_value = [mock_device]
         mock_settings.default_device_name = "test-protect"
 
@@ -14,9 +14,10 @@ def test_mcp_instance():
 
 
 @patch("unifi_mcp.server.mcp.run")
-@patch("unifi_mcp.server.settings")
-def test_main_execution(mock_settings, mock_run):
+@patch("unifi_mcp.server.get_settings")
+def test_main_execution(mock_get_settings, mock_run):
     """Test the main entry point."""
+    mock_settings = mock_get_settings.return_value
     mock_settings.devices = [MagicMock(name="test-device")]
     mock_settings.get_device_names.return_value = ["test-device"]
 